@@ -1,5 +1,4 @@
 from ursina import *
-from direct.stdpy import thread
 
 
 class LoadingWheel(Entity):
@@ -46,34 +45,29 @@ if __name__ == '__main__':
     loading_screen = LoadingWheel(enabled=False)
     from ursina.prefabs.health_bar import HealthBar
 
+    futures = []
+    bar = HealthBar(max_value=1, value=0, position=(0,0,-1), enabled=False)
+
     def load_textures():
-        for i in range(9999):
-            print('lolo'+'lol')
-        # window.color=color.white
-        return
+        # the textures load in the background, so the loading wheel keeps spinning and the bar shows the real progress
+        futures.clear()
+        futures.extend(load_texture_async(name) for name in ('brick', 'shore', 'sky_default', 'sky_sunset', 'reflection_map_3', 'heightmap_1'))
+        bar.max_value = len(futures)
+        bar.value = 0
+        bar.enabled = True
+        loading_screen.enabled = True
 
-        textures_to_load = ['brick', 'shore', 'grass', 'heightmap'] * 100
-        bar = HealthBar(max_value=len(textures_to_load), value=0, position=(0,0,-1))
-        for i, t in enumerate(textures_to_load):
-            load_texture(t)
-            print(i)
-            bar.value = i+1
-            print('loaded textturres')
-        # destroy(bar, delay=.01)
+    def update():
+        if not loading_screen.enabled:
+            return
+        bar.value = sum(f.done() for f in futures)
+        if bar.value == bar.max_value:
+            loading_screen.enabled = False
+            bar.enabled = False
+            print('loaded:', [f.result() for f in futures])
 
     def input(key):
         if key == 'space':
-            loading_screen.enabled = True
-            # window.color=color.black
-            # t = time.time()
-            # try:
-            #     thread.start_new_thread(target=load_textures)
-            # except:
-            #     print('error starting thread')
-
             load_textures()
-            loading_screen.enabled = False
-            print('---', time.time()-t)
-    # load_textures()
-    # invoke(load_textures, delay=0)
+
     app.run()
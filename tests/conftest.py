@@ -0,0 +1,11 @@
+import pytest
+from ursina import Ursina, application
+
+
+@pytest.fixture(scope='session', autouse=True)
+def app(tmp_path_factory):
+    # one headless app for all the tests, with an empty asset folder, so the import cache and saved files don't end up in the repo
+    application.asset_folder = tmp_path_factory.mktemp('assets')
+    application.compressed_models_folder = application.asset_folder / 'models_compressed/'
+    application.import_cache_folder = application.asset_folder / '.ursina_cache/'
+    return Ursina(headless=True)
@@ -0,0 +1,33 @@
+from ursina import Entity, duplicate
+
+
+def combined_cubes(count=3):
+    parent = Entity()
+    for i in range(count):
+        Entity(parent=parent, model='cube', x=i)
+    parent.combine()
+    return parent
+
+
+def test_combine_then_mesh_collider():
+    cube_polygons = len(Entity(model='cube', collider='mesh').collider.collision_polygons)
+    e = combined_cubes(3)
+    e.collider = 'mesh'
+    assert len(e.collider.collision_polygons) == cube_polygons * 3
+
+    copy = duplicate(e)
+    assert len(copy.collider.collision_polygons) == cube_polygons * 3
+
+
+def test_combine_then_colorize():
+    e = combined_cubes(2)
+    e.model.colorize()
+    assert len(e.model.colors) == len(e.model.vertices)
+
+
+def test_combine_then_save_obj(tmp_path):
+    e = combined_cubes(2)
+    e.model.save('combined.obj', tmp_path)
+    obj = (tmp_path / 'combined.obj').read_text()
+    assert obj.count('\nv ') == len(e.model.vertices)
+    assert obj.count('\nf ') == len(e.model.vertices) // 3
@@ -0,0 +1,89 @@
+import numpy
+from ursina import Entity, Mesh, Vec3, load_model
+from ursina.collider import MeshCollider
+from ursina.mesh_importer import ursina_mesh_to_obj
+
+
+def numpy_quad():
+    return Mesh(
+        vertices=numpy.array(((0,0,0), (1,0,0), (1,1,0), (0,1,0)), dtype=numpy.float32),
+        triangles=numpy.array(((0,1,2), (2,3,0)), dtype=numpy.uint32),
+        uvs=numpy.array(((0,0), (1,0), (1,1), (0,1)), dtype=numpy.float32),
+        )
+
+
+def test_mesh_collider_numpy():
+    e = Entity(model=numpy_quad(), collider='mesh')
+    assert isinstance(e.collider, MeshCollider)
+    assert len(e.collider.collision_polygons) == 2
+    assert e.collider.collision_polygons[0].get_point(0) == Vec3(1,1,0)
+
+
+def test_mesh_collider_numpy_without_triangles():
+    m = Mesh(vertices=numpy.array(((0,0,0), (1,0,0), (1,1,0)), dtype=numpy.float32))
+    collider = MeshCollider(Entity(model=m))
+    assert len(collider.collision_polygons) == 1
+
+
+def test_colorize_numpy():
+    m = numpy_quad()
+    m.colorize()
+    assert len(m.normals) == 4
+    assert len(m.colors) == 4
+
+
+def test_generate_normals_numpy():
+    m = numpy_quad()
+    normals = m.generate_normals(smooth=False)
+    assert numpy.allclose(numpy.abs(numpy.array(normals)), (0,0,1))
+
+
+def test_mesh_to_obj_numpy(tmp_path):
+    ursina_mesh_to_obj(numpy_quad(), 'numpy_quad', tmp_path)
+    lines = (tmp_path / 'numpy_quad.obj').read_text().splitlines()
+    assert [l for l in lines if l.startswith('v ')][2] == 'v 1.0 1.0 0.0'
+    assert len([l for l in lines if l.startswith('vt ')]) == 4
+    assert [l.strip() for l in lines if l.startswith('f ')] == ['f 1/1 2/2 3/3', 'f 3/3 4/4 1/1']
+
+
+def test_update_vertices_line_mesh():
+    m = Mesh(vertices=numpy.zeros((4,3)), triangles=((0,1), (2,3)), mode='line', static=False)
+    geom = m.geomNode.getGeom(0)
+    m.update_vertices(2, ((5,5,5), ))
+    assert m.geomNode.getNumGeoms() == 1
+    assert m.geomNode.getGeom(0).getPrimitive(0) == geom.getPrimitive(0)    # updated in place, not generated again
+    assert tuple(m.vertices[2]) == (5,5,5)
+
+
+def test_editing_a_loaded_model_in_place_doesnt_change_the_next_one():
+    e = Entity(model='cube')
+    original = Vec3(*e.model.vertices[0])
+    e.model.vertices[0] = Vec3(9,9,9)
+    e.model.generate()
+
+    other = Entity(model='cube')
+    assert other.model.vertices[0] == original
+    assert other.model.aabb[1] != Vec3(9,9,9)
+    assert e.model.aabb[1] == Vec3(9,9,9)
+
+
+def test_loaded_models_share_vertex_data_until_used():
+    a, b = load_model('cube'), load_model('cube')
+    assert a.geomNode.getGeom(0).getVertexData() == b.geomNode.getGeom(0).getVertexData()
+    a.colors = [(1,0,0,1)] * len(a.vertices)
+    a.generate()
+    assert a.geomNode.getGeom(0).getVertexData() != b.geomNode.getGeom(0).getVertexData()
+    assert not len(b.colors)
+
+
+def test_binary_models_keep_numpy_arrays_until_used(tmp_path):
+    numpy_quad().save('binary_quad.ursinamesh', tmp_path, binary=True)
+    m = load_model('binary_quad', tmp_path)
+    assert isinstance(m._vertices, numpy.ndarray)
+    assert m.geomNode.getGeom(0).getVertexData().getNumRows() == 4
+
+    assert isinstance(m.vertices, list) and m.vertices[2] == Vec3(1,1,0)
+    assert m.triangles == [(0,1,2), (2,3,0)]
+    m.vertices.append(Vec3(2,2,2))
+    assert isinstance(load_model('binary_quad', tmp_path)._vertices, numpy.ndarray)
+    assert len(load_model('binary_quad', tmp_path).vertices) == 4
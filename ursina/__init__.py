@@ -6,6 +6,7 @@ from ursina.ursinastuff import *
 from ursina.string_utilities import *
 from ursina.mesh_importer import *
 from ursina.texture_importer import *
+from ursina.async_loading import load_model_async, load_texture_async, load_audio_async
 from ursina import color
 from ursina.color import Color
 from ursina.sequence import Sequence, Func, Wait
@@ -14,8 +15,10 @@ from ursina.collider import *
 from ursina.collision_zone import CollisionZone
 from ursina.trigger import Trigger
 from ursina.audio import Audio
+from ursina.instanced_entity_group import InstancedEntityGroup
 from ursina.duplicate import duplicate
 from ursina import input_handler
+from ursina import profiler
 from ursina.vec3 import Vec3
 from ursina.shader import Shader
 from ursina.light import Light
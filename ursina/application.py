@@ -3,9 +3,13 @@ from pathlib import Path
 from panda3d.core import getModelPath
 
 
+headless = False    # set with Ursina(headless=True). runs without a window, so no rendering, real input or editor ui.
 paused = False
 time_scale = 1
 sequences = list()
+fixed_timestep = None       # set to for example 1/60 to call fixed_update() at a constant rate, independent of the frame rate
+max_fixed_steps = 5         # max fixed_update() calls per frame. prevents spiraling when the game can't keep up.
+fixed_timestep_alpha = 0    # how far we are between the last and the next fixed step (0-1). use it to interpolate rendering.
 trace_entity_definition = False # enable to set entity.line_definition
 print_entity_definition = False
 
@@ -31,6 +35,7 @@ fonts_folder = asset_folder / 'fonts/'
 
 compressed_textures_folder = asset_folder / 'textures_compressed/'
 compressed_models_folder = asset_folder / 'models_compressed/'
+import_cache_folder = asset_folder / '.ursina_cache/'    # converted models and textures, so they only get converted once. see ursina.assets.
 
 # fonts are loaded py panda3d, so add paths here
 _model_path = getModelPath()
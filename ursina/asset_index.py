@@ -0,0 +1,153 @@
+'''
+Finds asset files by name without walking the folder on every lookup, like folder.glob('**/' + pattern) would.
+Each folder gets indexed once, the first time something is looked up in it. Missing files don't need a walk either,
+just a check of the directory modification times, in case the file was just written. The index gets rebuilt when
+a directory in it changes, which is checked on every miss, at most every check_interval seconds when the file is found,
+and on the next lookup after invalidate(). With watch() and the watchdog package installed, file system events invalidate it instead.
+'''
+import os
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+
+check_interval = 1      # seconds between checking the directory modification times when the file is found. None to only check on misses.
+indexes = dict()        # folder : AssetIndex
+
+
+class AssetIndex:
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.watched = False    # True when watch() rebuilds it on file system events instead
+        self.dirty = False      # rebuild on the next lookup
+        self.build()
+
+
+    def build(self):
+        files = dict()         # file name : list of paths, in the order os.walk finds them
+        dir_mtimes = dict()    # directory : modification time, to see if files got added or removed
+
+        if self.folder.is_dir():
+            for root, dirs, file_names in os.walk(self.folder):
+                try:
+                    dir_mtimes[root] = os.stat(root).st_mtime_ns
+                except OSError:
+                    continue
+                for file_name in file_names:
+                    files.setdefault(os.path.normcase(file_name), list()).append(os.path.join(root, file_name))
+
+        self.files = files
+        self.dir_mtimes = dir_mtimes
+        self.glob_cache = dict()    # pattern : list of paths, for patterns with wildcards
+        self.last_check = time.perf_counter()
+        self.dirty = False
+
+
+    def is_stale(self):
+        if not self.dir_mtimes:
+            return self.folder.is_dir()
+
+        for directory, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+
+    def check(self):
+        # rebuild if something changed, but don't check more often than check_interval
+        if self.dirty:
+            return self.build()
+        if self.watched or check_interval is None:
+            return
+        if time.perf_counter() - self.last_check < check_interval:
+            return
+
+        self.last_check = time.perf_counter()
+        if self.is_stale():
+            self.build()
+
+
+    def glob(self, pattern):
+        # same as list(folder.glob('**/' + pattern)), but for files only
+        self.check()
+        paths = self._lookup(pattern)
+        if not paths and self.is_stale():   # only hits wait for check_interval, so a file that was just written gets found right away
+            self.build()
+            paths = self._lookup(pattern)
+        return paths
+
+
+    def _lookup(self, pattern):
+        name = os.path.normcase(pattern.replace('\\', '/').rsplit('/', 1)[-1])
+
+        if any(c in name for c in '*?['):
+            if pattern not in self.glob_cache:
+                self.glob_cache[pattern] = [Path(p) for key, paths in self.files.items() if fnmatchcase(key, name) for p in paths]
+            paths = self.glob_cache[pattern]
+        else:
+            paths = [Path(p) for p in self.files.get(name, ())]
+
+        if '/' in pattern.replace('\\', '/'):   # with folders in the pattern, the end of the path has to match it
+            paths = [p for p in paths if p.match(pattern)]
+        return paths
+
+
+
+def find(folder, pattern):
+    # returns the files in folder or its subfolders matching pattern, which can be a file name or use * and ? wildcards
+    folder = Path(folder)
+    if folder not in indexes:
+        indexes[folder] = AssetIndex(folder)
+    return indexes[folder].glob(pattern)
+
+
+def invalidate(folder=None):
+    # makes the next lookup rebuild the index of folder and the folders containing it. call this after writing assets yourself.
+    for f, index in indexes.items():
+        if folder is None or f == Path(folder) or Path(folder) in f.parents or f in Path(folder).parents:
+            index.dirty = True
+
+
+def watch(folder=None):
+    # rebuilds the index on file system events instead of checking modification times. returns False if watchdog isn't installed.
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except (ModuleNotFoundError, ImportError):
+        return False
+
+    from ursina import application
+    folder = Path(folder) if folder else application.asset_folder
+    if folder not in indexes:
+        indexes[folder] = AssetIndex(folder)
+    index = indexes[folder]
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.event_type in ('created', 'deleted', 'moved'):
+                index.dirty = True  # rebuilt on the next lookup, on the main thread
+
+    observer = Observer()
+    observer.schedule(Handler(), str(folder), recursive=True)
+    observer.daemon = True
+    observer.start()
+    index.watched = True
+    return True
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    from ursina import asset_index
+    app = Ursina()
+
+    t = time.perf_counter()
+    print(asset_index.find(application.internal_textures_folder, 'brick.*'))
+    print('first lookup, with indexing:', time.perf_counter() - t)
+    t = time.perf_counter()
+    print(asset_index.find(application.internal_textures_folder, 'missing_texture.png'))
+    print('miss:', time.perf_counter() - t)
+    app.run()
@@ -0,0 +1,258 @@
+'''
+Import cache for converted assets. Models made from .obj, .blend and text .ursinamesh files get stored as binary .ursinamesh files,
+and textures as .txo files with their mipmaps, in application.import_cache_folder. The next time the same source file gets loaded,
+the converted version is used instead, so nothing has to be parsed, decoded or exported with Blender again.
+
+Cache entries are keyed by the source path, its modification time and size (or its content, with hash_contents = True)
+and the importer version, so changed files get converted again. Maintain the cache with:
+    python -m ursina.assets --prune      remove entries for source files that changed or are gone
+    python -m ursina.assets --rebuild    clear the cache and convert every asset in the asset folder again
+
+compress_all() makes the files that get shipped with a game instead: .obj files exported from .blend files with Blender,
+and compressed versions of .psd files and big .png files. It runs the conversions in parallel and skips the ones that are up to date.
+    python -m ursina.assets --compress   or call compress_all() from a build script
+'''
+import os
+import json
+import threading
+from hashlib import sha1
+from pathlib import Path
+from ursina import application
+
+
+enabled = True
+hash_contents = False   # key the entries by the content of the source file instead of its modification time and size. slower, but survives checkouts and copies.
+importer_versions = {   # bump when an importer changes, so its old results don't get used
+    '.obj' : 2,
+    '.blend' : 1,
+    '.ursinamesh' : 1,
+    'texture' : 1,
+    }
+compress_workers = None     # processes for compress_all(). None to use one per cpu core.
+model_types = ('.obj', '.blend', '.ursinamesh')
+texture_types = ('.tif', '.jpg', '.jpeg', '.png', '.gif')
+
+_manifest = None     # cache file name : {'source' : path, 'importer' : importer}
+_manifest_lock = threading.Lock()   # assets can get converted on the threads of ursina.async_loading
+
+
+def cache_key(source, importer):
+    source = Path(source).resolve()
+    if hash_contents:
+        digest = sha1()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(2**20), b''):
+                digest.update(chunk)
+        version = digest.hexdigest()
+    else:
+        stat = os.stat(source)
+        version = f'{stat.st_mtime_ns}:{stat.st_size}'
+
+    return sha1(f'{importer}:{importer_versions[importer]}:{source}:{version}'.encode()).hexdigest()[:20]
+
+
+def cache_path(source, importer, suffix):
+    return application.import_cache_folder / f'{Path(source).stem}_{cache_key(source, importer)}{suffix}'
+
+
+def manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(application.import_cache_folder / 'manifest.json') as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = dict()
+    return _manifest
+
+
+def _add_to_manifest(path, source, importer):
+    with _manifest_lock:
+        manifest()[path.name] = {'source' : str(Path(source).resolve()), 'importer' : importer}
+        with open(application.import_cache_folder / 'manifest.json', 'w') as f:
+            json.dump(_manifest, f, indent=4)
+
+
+def cached_mesh(source, import_function):
+    # returns the arguments for Mesh() converted from source, from the cache if it's there, otherwise made with import_function(source) and added to it
+    source = Path(source)
+    if not enabled:
+        return import_function(source)
+
+    from ursina.mesh_importer import read_binary_ursinamesh, write_binary_ursinamesh
+    path = cache_path(source, source.suffix, '.ursinamesh')
+    if path.exists():
+        try:
+            return read_binary_ursinamesh(path)
+        except Exception as e:
+            print('invalid import cache file:', path, e)
+
+    data = import_function(source)
+    if data is not None:
+        try:
+            application.import_cache_folder.mkdir(parents=True, exist_ok=True)
+            write_binary_ursinamesh(data, path)
+            _add_to_manifest(path, source, source.suffix)
+        except OSError as e:
+            print('could not add to import cache:', path, e)
+    return data
+
+
+def cached_texture(source):
+    # returns the panda3d texture loaded from source, decoded and with mipmaps, from the cache if it's there
+    from panda3d.core import Filename
+    source = Path(source)
+    if not enabled:
+        return loader.loadTexture(Filename.fromOsSpecific(str(source)))
+
+    path = cache_path(source, 'texture', '.txo')
+    if path.exists():
+        texture = loader.loadTexture(Filename.fromOsSpecific(str(path)))
+        if texture:
+            return texture
+
+    texture = loader.loadTexture(Filename.fromOsSpecific(str(source)))
+    if texture and texture.hasRamImage():
+        try:
+            application.import_cache_folder.mkdir(parents=True, exist_ok=True)
+            texture.generateRamMipmapImages()
+            if texture.write(Filename.fromOsSpecific(str(path))):
+                _add_to_manifest(path, source, 'texture')
+        except OSError as e:
+            print('could not add to import cache:', path, e)
+    return texture
+
+
+def prune():
+    # removes the cache files whose source file changed or is gone. returns the removed paths.
+    entries = manifest()
+    removed = list()
+    if not application.import_cache_folder.exists():
+        return removed
+
+    for path in application.import_cache_folder.iterdir():
+        if path.name == 'manifest.json':
+            continue
+        entry = entries.get(path.name)
+        try:
+            if entry and Path(entry['source']).exists() and cache_path(entry['source'], entry['importer'], path.suffix).name == path.name:
+                continue
+        except KeyError:    # importer that doesn't exist anymore
+            pass
+
+        try:
+            path.unlink()
+        except OSError as e:
+            print('could not remove:', path, e)
+            continue
+        entries.pop(path.name, None)
+        removed.append(path)
+
+    if removed:
+        with open(application.import_cache_folder / 'manifest.json', 'w') as f:
+            json.dump(entries, f, indent=4)
+    return removed
+
+
+def clear():
+    global _manifest
+    if application.import_cache_folder.exists():
+        for path in application.import_cache_folder.iterdir():
+            try:
+                path.unlink()
+            except OSError as e:
+                print('could not remove:', path, e)
+    _manifest = dict()
+
+
+def rebuild(folder=None):
+    # clears the cache and converts all the models and textures in folder, the asset folder by default. returns the source files.
+    from ursina import asset_index
+    from ursina.mesh_importer import import_model_file, is_binary_ursinamesh
+    from ursina.texture import Texture
+    folder = Path(folder) if folder else application.asset_folder
+    clear()
+    asset_index.invalidate(folder)
+
+    converted = list()
+    for suffix in model_types + texture_types:
+        for source in asset_index.find(folder, '*' + suffix):
+            if application.import_cache_folder in source.parents:
+                continue
+            if suffix == '.ursinamesh' and is_binary_ursinamesh(source):
+                continue    # already as fast as it gets
+
+            print('converting:', source)
+            try:
+                if suffix in model_types:
+                    import_model_file(source)
+                else:
+                    Texture(source)
+                converted.append(source)
+            except Exception as e:
+                print('could not convert:', source, e)
+
+    return converted
+
+
+def is_up_to_date(source, outputs):
+    # True if any of the output files exists and is at least as new as the source file
+    source_time = os.stat(source).st_mtime_ns
+    for output in outputs:
+        try:
+            if os.stat(output).st_mtime_ns >= source_time:
+                return True
+        except OSError:
+            pass
+    return False
+
+
+def print_progress(done, total, job, result):
+    print(f'[{done}/{total}]', job[0], '-->', result if result else 'skipped')
+
+
+def run_jobs(function, jobs, workers=1, processes=True, on_progress=print_progress):
+    # calls function(*job) for each of the jobs and returns the results, in the same order. with more than one worker, they run on a
+    # process pool, or a thread pool with processes=False. on_progress(done, total, job, result) gets called on this thread after each one.
+    # like any process pool, the calling script needs an if __name__ == '__main__': guard on windows and macos.
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    results = [None] * len(jobs)
+    if workers <= 1 or len(jobs) <= 1:
+        for i, job in enumerate(jobs):
+            try:
+                results[i] = function(*job)
+            except Exception as e:
+                print('could not convert:', job[0], e)
+            if on_progress:
+                on_progress(i+1, len(jobs), job, results[i])
+        return results
+
+    pool_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool_type(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(function, *job) : i for i, job in enumerate(jobs)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                print('could not convert:', jobs[i][0], e)
+            if on_progress:
+                on_progress(done, len(jobs), jobs[i], results[i])
+    return results
+
+
+def compress_all(folder=None, workers=None, force=False, on_progress=print_progress):
+    # exports the .blend files in folder (the asset folder by default) to its models_compressed folder, and compresses its .psd and big .png files
+    # to its textures_compressed folder, with compress_workers at a time. files older than their converted version get skipped, unless force is True.
+    # returns the converted source files.
+    from ursina.mesh_importer import compress_models
+    from ursina.texture_importer import compress_textures
+    folder = Path(folder) if folder else application.asset_folder
+    workers = workers or compress_workers
+
+    converted = compress_models(path=folder, outpath=folder / 'models_compressed', workers=workers, force=force, on_progress=on_progress)
+    converted += compress_textures(path=folder, outpath=folder / 'textures_compressed', workers=workers, force=force, on_progress=on_progress)
+    return converted
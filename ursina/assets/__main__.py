@@ -0,0 +1,43 @@
+import sys
+from textwrap import dedent
+from ursina import *
+from ursina import assets
+
+
+folder = None
+workers = None
+
+for i, arg in enumerate(sys.argv):
+    if arg == '--help' or len(sys.argv) == 1:
+        print(dedent('''
+            maintains the import cache in application.import_cache_folder, and compresses assets.
+            --prune             remove entries for source files that changed or are gone
+            --rebuild           clear the cache and convert all the models and textures in the asset folder again
+            --compress          export .blend files to .obj and compress .psd and big .png files, see compress_all()
+            --folder path       the folder to convert with --rebuild or --compress, instead of the asset folder
+            --workers n         the number of processes for --compress, instead of one per cpu core'''
+            )
+        )
+        sys.exit()
+
+    elif arg == '--folder':
+        folder = sys.argv[i+1]
+
+    elif arg == '--workers':
+        workers = int(sys.argv[i+1])
+
+
+if '--compress' in sys.argv:
+    converted = assets.compress_all(folder, workers)
+    print(f'compressed {len(converted)} file(s)')
+
+if '--prune' in sys.argv or '--rebuild' in sys.argv:
+    app = Ursina(headless=True)    # textures need the loader
+
+if '--prune' in sys.argv:
+    removed = assets.prune()
+    print(f'removed {len(removed)} cache file(s) from: {application.import_cache_folder}')
+
+if '--rebuild' in sys.argv:
+    converted = assets.rebuild(folder)
+    print(f'converted {len(converted)} file(s) to: {application.import_cache_folder}')
@@ -0,0 +1,194 @@
+'''
+Loads models, textures and audio in the background, so the game keeps running while they load.
+Reading and parsing the files happens on a thread pool. Making the Mesh, Texture or sound out of that has to happen
+on the main thread, which Ursina does at the start of every frame, for at most frame_budget seconds.
+
+    future = load_model_async('castle')
+    Entity(model=future, texture=load_texture_async('castle_texture'))    # shows placeholder_model until it's loaded
+    future.add_done_callback(lambda f: print('loaded:', f.result()))
+
+The futures are concurrent.futures.Future, and they get their result on the main thread, so the done callbacks get called there too.
+They resolve to None if the asset can't be found, like load_model() and load_texture() return None.
+Don't call future.result() on the main thread before it's done, since nothing will finish it. Use wait() instead.
+'''
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import copy
+from ursina import application
+from ursina import asset_index
+from ursina import assets
+from ursina import mesh_importer
+from ursina import texture_importer
+from ursina.texture import Texture
+
+
+max_workers = 4
+frame_budget = .004             # seconds per frame to spend on making the loaded assets. at least one gets made each frame.
+placeholder_model = 'cube'      # shown by entities while their model is loading. None to show nothing.
+
+_executor = None
+_finished = deque()     # (future, finish function, future of the read function), read on the thread pool and waiting for the main thread
+_loading = dict()       # (asset type, name) : future, so loading something again before it's done doesn't read it twice
+
+
+def _submit(read, finish, *args):
+    # calls read(*args) on the thread pool, then finish() with the result on the main thread. returns a future of what finish() returns.
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ursina_loader')
+
+    future = Future()
+    _executor.submit(read, *args).add_done_callback(lambda read_future: _finished.append((future, finish, read_future)))
+    return future
+
+
+def _load_once(key, load):
+    # calls load() only if key isn't loading already. returns a new future of a copy of the result, so each caller gets its own.
+    loading = _loading.get(key)
+    if loading is None:
+        loading = load()
+        _loading[key] = loading
+        loading.add_done_callback(lambda f: _loading.pop(key, None))
+
+    future = Future()
+    loading.add_done_callback(lambda f: _copy_result(f, future))
+    return future
+
+
+def _copy_result(source, target):
+    if not target.set_running_or_notify_cancel():
+        return
+    if source.exception():
+        target.set_exception(source.exception())
+    else:
+        target.set_result(copy(source.result()) if source.result() is not None else None)
+
+
+def _resolved(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def update(budget=None):
+    # finishes the assets that are done loading, until budget seconds (frame_budget by default) are used up. Ursina calls this every frame.
+    if budget is None:
+        budget = frame_budget
+
+    t = time.perf_counter()
+    while _finished:
+        future, finish, read_future = _finished.popleft()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            result = finish(read_future.result())
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+        if time.perf_counter() - t >= budget:
+            break
+
+
+def wait(*futures, timeout=None):
+    # blocks until the futures are done, finishing them on this thread, and returns their results. for loading before the game starts.
+    t = time.perf_counter()
+    while not all(f.done() for f in futures):
+        if timeout is not None and time.perf_counter() - t > timeout:
+            raise TimeoutError(f'{sum(not f.done() for f in futures)} of {len(futures)} assets not loaded in {timeout} seconds')
+        if _finished:
+            update(budget=float('inf'))
+        else:
+            time.sleep(.001)
+
+    return [f.result() for f in futures]
+
+
+def loading_count():
+    # the number of assets that are loading or waiting to be finished
+    return len(_loading) + len(_finished)
+
+
+
+def load_model_async(name, path=None):
+    # returns a future of the Mesh load_model(name, path) would return. without a path, it looks in the asset folder,
+    # then in ursina's own models, like Entity(model=name) does.
+    if name in mesh_importer.imported_meshes:
+        return _resolved(copy(mesh_importer.imported_meshes[name]))
+
+    folders = (path, ) if path else (application.asset_folder, application.internal_models_compressed_folder)
+    for folder in folders:
+        for filetype in ('.bam', '.ursinamesh', '.obj', '.blend'):
+            for filename in asset_index.find(folder, f'{name}{filetype}'):
+                if filetype == '.bam':
+                    return _submit(lambda: None, lambda data, filename=filename: loader.loadModel(filename))
+
+                def finish(data, filename=filename):
+                    if data is None:
+                        return None
+                    m = mesh_importer.mesh_from_data(data)
+                    m.path = filename
+                    m.name = name
+                    mesh_importer.imported_meshes[name] = m
+                    return m
+
+                return _load_once(('model', name), lambda: _submit(mesh_importer.read_model_file, finish, filename))
+
+    return _resolved(None)
+
+
+def load_texture_async(name, path=None):
+    # returns a future of the Texture load_texture(name, path) would return. the image gets decoded and mipmapped on the thread pool.
+    if texture_importer.textureless:
+        return _resolved(None)
+    if name in texture_importer.imported_textures:
+        return _resolved(copy(texture_importer.imported_textures[name]))
+
+    filename = texture_importer.find_texture(name, path)
+    if filename is None:    # movie textures and .psd files that have to be converted first get loaded right away
+        return _resolved(texture_importer.load_texture(name, path))
+
+    def finish(panda_texture):
+        if not panda_texture:
+            return None
+        t = Texture(panda_texture)
+        t.path = filename
+        texture_importer.imported_textures[name] = t
+        return t
+
+    return _load_once(('texture', name), lambda: _submit(assets.cached_texture, finish, filename))
+
+
+def load_audio_async(name):
+    # returns a future of the sound Audio(name) would load. the file gets read on the thread pool, so it's in the disk cache when
+    # loadSfx() opens it. the decoding still happens on the main thread, since panda3d's audio managers aren't thread safe.
+    from ursina.audio import find_audio
+    filename = find_audio(name)
+    if filename is None:
+        return _resolved(None)
+
+    def read(filename):
+        with open(application.asset_folder / filename, 'rb') as f:
+            while f.read(2**20):
+                pass
+
+    return _submit(read, lambda data: loader.loadSfx(filename), filename)
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    from ursina import async_loading
+    app = Ursina()
+
+    entities = [Entity(model=load_model_async('sphere'), texture=load_texture_async('brick'), x=i*1.5-3) for i in range(5)]
+    textures = [load_texture_async(name) for name in ('shore', 'sky_default', 'sky_sunset', 'reflection_map_3')]
+    status = Text(y=-.4, origin=(0,0))
+
+    def update():
+        status.text = f'loading: {async_loading.loading_count()}'
+
+    EditorCamera()
+    app.run()
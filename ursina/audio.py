@@ -1,10 +1,29 @@
 from ursina import *
+from ursina import asset_index
+from concurrent.futures import Future
 
 # Set to avoid name-space conflicts in the Audio class.
 _destroy = destroy
 
 
+def find_audio(name):
+    # returns the path of the sound file, relative to the asset folder, or None
+    for suffix in ('.ogg', '.mp3', '.wav'):
+        for f in asset_index.find(application.asset_folder, f'{name}{suffix}'):
+            p = str(f.resolve())
+            return p[len(str(application.asset_folder.resolve()))+1:]
+    return None
+
+
 class Audio(Entity):
+
+    _setattr_hooks = {
+        'volume' : '_set_clip_setting',
+        'pitch' : '_set_clip_setting',
+        'loop' : '_set_clip_setting',
+        'loops' : '_set_clip_setting',
+        }
+
     def __init__(self, sound_file_name='', autoplay=True, **kwargs):
         super().__init__(**kwargs)
         # printvar(sound_file_name)
@@ -30,7 +49,7 @@ class Audio(Entity):
         if autoplay:
             self.play()
 
-    def __setattr__(self, name, value):
+    def _set_clip_setting(self, name, value):
         if hasattr(self, 'clip') and self._clip:
             if name == 'volume':
                 self._clip.setVolume(value)
@@ -44,10 +63,7 @@ class Audio(Entity):
             if name == 'loops':
                 self._clip.setLoopCount(value)
 
-        try:
-            super().__setattr__(name, value)
-        except Exception as e:
-            return e
+        self._set(name, value)
 
     @property
     def clip(self):
@@ -55,23 +71,43 @@ class Audio(Entity):
 
     @clip.setter
     def clip(self, value):
+        self._clip_future = None
+        if isinstance(value, Future):   # from load_audio_async()
+            if not value.done():
+                self._clip = None
+                self._clip_future = value
+                value.add_done_callback(self._on_clip_loaded)
+                return
+            value = value.result()
+
         if isinstance(value, str):
             self.name = value
 
-            for suffix in ('.ogg', '.mp3', '.wav'):
-                for f in application.asset_folder.glob(f'**/{value}{suffix}'):
-                    p = str(f.resolve())
-                    p = p[len(str(application.asset_folder.resolve())):]
-                    self._clip = loader.loadSfx(p[1:])
-                    # print('...loaded audio clip:', f, p)
-                    return
-                # except:
-                #     pass
+            filename = find_audio(value)
+            if filename:
+                self._clip = loader.loadSfx(filename)
+                # print('...loaded audio clip:', filename)
+                return
             print('no audio found with name:', value, 'supported formats: .ogg, .mp3, .wav')
             return
         else:
             self._clip = value
 
+    def _on_clip_loaded(self, future):
+        if future is not self._clip_future or self.is_empty():
+            return
+        if future.exception():
+            print('could not load audio:', future.exception())
+            return
+        if future.result() is None:
+            print('no audio found, supported formats: .ogg, .mp3, .wav')
+            return
+        self.clip = future.result()
+        for name in ('volume', 'pitch', 'loop', 'loops'):   # apply the settings made while it was loading
+            setattr(self, name, getattr(self, name))
+        if self.autoplay:
+            self.play()
+
     @property
     def length(self):
         return self.clip.length() if self.clip else 0
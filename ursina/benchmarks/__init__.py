@@ -0,0 +1,169 @@
+'''
+Micro benchmarks for the engine's hot paths. Run them with:
+    python -m ursina.benchmarks
+
+Benchmarks with a memory_target also measure the peak memory allocated by one extra run, with tracemalloc.
+They run with an empty, temporary asset folder, so they don't use or add to the import cache of the project they're run in.
+
+Results get saved as json, and can be compared to a previous run to find regressions:
+    python -m ursina.benchmarks --out baseline.json
+    python -m ursina.benchmarks --compare baseline.json
+'''
+import sys
+import json
+import platform
+import statistics
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from pathlib import Path
+
+
+benchmarks = dict()     # name : Benchmark
+default_threshold = 1.25    # flag as regression when this many times slower than the baseline
+
+
+class Benchmark():
+    def __init__(self, name, setup, repeat=5, target=None, memory_target=None):
+        self.name = name
+        self.setup = setup      # function that prepares the benchmark and returns the function to time
+        self.repeat = repeat
+        self.target = target    # optional max median time in seconds. gets reported as pass/fail.
+        self.memory_target = memory_target  # optional max peak memory in bytes. gets reported as pass/fail.
+
+
+def temporary_folder():
+    # an empty folder for the files a benchmark needs. gets deleted after the benchmark.
+    folder = tempfile.TemporaryDirectory()
+    _temporary_folders.append(folder)
+    return Path(folder.name)
+
+_temporary_folders = list()
+
+
+def benchmark(name, repeat=5, target=None, memory_target=None):
+    # decorator for adding a benchmark. the decorated function should do the setup and return the function to time.
+    def decorator(setup):
+        benchmarks[name] = Benchmark(name, setup, repeat, target, memory_target)
+        return setup
+    return decorator
+
+
+def run_benchmark(b):
+    from ursina import scene, application, destroy
+
+    entity_count = len(scene.entities)
+    sequence_count = len(application.sequences)
+
+    try:
+        func = b.setup()
+        times = list()
+        for i in range(b.repeat):
+            start = perf_counter()
+            func()
+            times.append(perf_counter() - start)
+
+        if b.memory_target is not None:
+            # separate from the timed runs, since tracing allocations slows them down
+            tracemalloc.start()
+            func()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    finally:
+        for folder in _temporary_folders:
+            folder.cleanup()
+        _temporary_folders.clear()
+
+    # clean up entities and sequences created by the benchmark
+    for e in scene.entities[entity_count:]:
+        destroy(e)
+    del application.sequences[sequence_count:]
+
+    result = {
+        'min' : min(times),
+        'median' : statistics.median(times),
+        'mean' : statistics.mean(times),
+        'repeat' : b.repeat,
+        }
+    if b.target is not None:
+        result['target'] = b.target
+        result['passed_target'] = result['median'] <= b.target
+    if b.memory_target is not None:
+        result['peak_memory'] = peak_memory
+        result['memory_target'] = b.memory_target
+        result['passed_memory_target'] = peak_memory <= b.memory_target
+
+    return result
+
+
+@contextmanager
+def empty_asset_folder():
+    # use an empty asset folder, so the meshes the benchmarks save and the import cache don't end up in the real one, or get used from it
+    from ursina import application, assets
+    folders = application.asset_folder, application.compressed_models_folder, application.import_cache_folder
+    asset_folder = tempfile.TemporaryDirectory()
+    application.asset_folder = Path(asset_folder.name)
+    application.compressed_models_folder = application.asset_folder / 'models_compressed/'
+    application.import_cache_folder = application.asset_folder / '.ursina_cache/'
+    assets._manifest = None
+    try:
+        yield application.asset_folder
+    finally:
+        application.asset_folder, application.compressed_models_folder, application.import_cache_folder = folders
+        assets._manifest = None
+        asset_folder.cleanup()
+
+
+def run(name_filter=''):
+    from ursina.benchmarks import hot_paths    # registers the benchmarks
+    results = dict()
+
+    with empty_asset_folder():
+        for name, b in benchmarks.items():
+            if name_filter and name_filter not in name:
+                continue
+
+            results[name] = run_benchmark(b)
+            r = results[name]
+            line = f'{name:<40} median: {r["median"]*1000:10.3f} ms   min: {r["min"]*1000:10.3f} ms'
+            if 'target' in r:
+                line += f'   target: {r["target"]*1000:.1f} ms ' + ('ok' if r['passed_target'] else 'MISSED')
+            if 'memory_target' in r:
+                line += f'   peak memory: {r["peak_memory"]/2**20:.1f} MB   target: {r["memory_target"]/2**20:.1f} MB ' + ('ok' if r['passed_memory_target'] else 'MISSED')
+            print(line)
+
+    return results
+
+
+def save(results, path):
+    data = {
+        'python' : platform.python_version(),
+        'platform' : platform.platform(),
+        'results' : results,
+        }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+
+    print('saved benchmark results to:', path)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=default_threshold):
+    # returns a list of (name, baseline median, current median, ratio) for the benchmarks that got slower than threshold
+    regressions = list()
+    for name, r in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = r['median'] / max(baseline[name]['median'], 1e-9)
+        status = 'REGRESSION' if ratio > threshold else ''
+        print(f'{name:<40} {baseline[name]["median"]*1000:10.3f} ms -> {r["median"]*1000:10.3f} ms  ({ratio:.2f}x) {status}')
+        if ratio > threshold:
+            regressions.append((name, baseline[name]['median'], r['median'], ratio))
+
+    return regressions
@@ -0,0 +1,47 @@
+import sys
+from textwrap import dedent
+from ursina import *
+from ursina import benchmarks
+
+
+out_path = None
+baseline_path = None
+threshold = benchmarks.default_threshold
+name_filter = ''
+
+for i, arg in enumerate(sys.argv):
+    if arg == '--help':
+        print(dedent('''
+            runs the ursina micro benchmarks in headless mode.
+            --out path.json         save the results
+            --compare path.json     compare the results to a previous run and exit with 1 if anything got slower
+            --threshold 1.25        how many times slower counts as a regression
+            --filter name           only run benchmarks with this in their name'''
+            )
+        )
+        sys.exit()
+
+    elif arg == '--out':
+        out_path = sys.argv[i+1]
+    elif arg == '--compare':
+        baseline_path = sys.argv[i+1]
+    elif arg == '--threshold':
+        threshold = float(sys.argv[i+1])
+    elif arg == '--filter':
+        name_filter = sys.argv[i+1]
+
+
+with benchmarks.empty_asset_folder():
+    app = Ursina(headless=True)
+    results = benchmarks.run(name_filter)
+
+if out_path:
+    benchmarks.save(results, out_path)
+
+if baseline_path:
+    print(f'\ncomparing to: {baseline_path}')
+    regressions = benchmarks.compare(results, benchmarks.load(baseline_path), threshold)
+    if regressions:
+        print(f'{len(regressions)} regression(s) found')
+        sys.exit(1)
+    print('no regressions found')
@@ -0,0 +1,312 @@
+import random
+from ursina import *
+from ursina.benchmarks import benchmark, temporary_folder
+from ursina import mesh_importer, texture_importer, asset_index, assets
+from panda3d.core import TexturePool
+
+
+def _grid_mesh(vertex_count):
+    # triangle soup with colors and uvs, so every vertex column gets written
+    vertex_count -= vertex_count % 3
+    random.seed(vertex_count)
+    vertices = [(random.random(), random.random(), random.random()) for i in range(vertex_count)]
+    colors = [color.white for i in range(vertex_count)]
+    uvs = [(i % 2, (i // 2) % 2) for i in range(vertex_count)]
+    return vertices, colors, uvs
+
+
+# entities
+@benchmark('Entity() x1000')
+def entity_construction():
+    def run():
+        for i in range(1000):
+            Entity()
+    return run
+
+
+@benchmark('Entity.spawn_many() 10000 cubes', repeat=3, target=1.0)
+def entity_spawn_many():
+    positions = [(i%100, 0, i//100) for i in range(10000)]
+    return lambda: Entity.spawn_many(10000, model='cube', color=color.orange, per_instance={'position':positions})
+
+
+@benchmark('Entity(model=\'cube\') x10000', repeat=1)
+def entity_construction_cubes():
+    def run():
+        for i in range(10000):
+            Entity(model='cube', color=color.orange, position=(i%100, 0, i//100))
+    return run
+
+
+@benchmark('Entity attribute writes x100000', repeat=5)
+def entity_setattr():
+    e = Entity()
+    def run():
+        for i in range(50000):
+            e.speed = i         # ordinary attribute
+            e.x = i             # property
+    return run
+
+
+@benchmark('Entity transform reads x10000', repeat=5)
+def entity_transform_reads():
+    a = Entity()
+    b = Entity(parent=a, x=1, rotation_y=30)
+    c = Entity(parent=b, z=2, scale=2)
+    def run():
+        for i in range(10000):
+            c.position, c.rotation, c.scale
+            c.world_position, c.world_rotation, c.world_scale
+            c.forward, c.right, c.up
+    return run
+
+
+@benchmark('Entity.bounds x1000 sphere', repeat=5)
+def entity_bounds():
+    e = Entity(model='sphere', scale=2)
+    def run():
+        for i in range(1000):
+            e.bounds
+    return run
+
+
+@benchmark('InstancedEntityGroup 10000 cubes', repeat=3)
+def instanced_entity_group():
+    positions = [(i%100, 0, i//100) for i in range(10000)]
+    return lambda: InstancedEntityGroup(model='cube', positions=positions)
+
+
+@benchmark('InstancedEntityGroup.update_instances() 1000 of 10000', repeat=10)
+def instanced_entity_group_update():
+    import numpy
+    group = InstancedEntityGroup(model='cube', positions=[(i%100, 0, i//100) for i in range(10000)])
+    indices = numpy.arange(0, 10000, 10)
+    return lambda: group.update_instances(indices, rotations=numpy.random.uniform(0, 360, (1000,3)))
+
+
+# meshes
+for vertex_count, repeat in ((1_000, 20), (100_000, 3), (1_000_000, 1)):
+    def mesh_generate(vertex_count=vertex_count):
+        vertices, colors, uvs = _grid_mesh(vertex_count)
+        m = Mesh(vertices=vertices, colors=colors, uvs=uvs)
+        return m.generate
+
+    benchmark(f'Mesh.generate() {vertex_count} vertices', repeat=repeat)(mesh_generate)
+
+    def mesh_generate_numpy(vertex_count=vertex_count):
+        import numpy
+        vertices, colors, uvs = _grid_mesh(vertex_count)
+        m = Mesh(vertices=numpy.array(vertices), colors=numpy.array(colors), uvs=numpy.array(uvs))
+        return m.generate
+
+    benchmark(f'Mesh.generate() {vertex_count} vertices numpy', repeat=repeat)(mesh_generate_numpy)
+
+
+@benchmark('Mesh.generate() 10000 line segments', repeat=5)
+def mesh_generate_lines():
+    vertices = [(i, i%2, 0) for i in range(20000)]
+    m = Mesh(vertices=vertices, triangles=[(i, i+1) for i in range(0, 20000, 2)], mode='line')
+    return m.generate
+
+
+@benchmark('Mesh.update_vertices() 1000 of 100000', repeat=20)
+def mesh_update_vertices():
+    import numpy
+    vertices, colors, uvs = _grid_mesh(100_000)
+    m = Mesh(vertices=numpy.array(vertices), colors=numpy.array(colors), static=False)
+    new_vertices = numpy.random.random((1000, 3))
+    return lambda: m.update_vertices(5000, new_vertices)
+
+
+@benchmark('Mesh.update_vertices() append x1000', repeat=5)
+def mesh_update_vertices_append():
+    import numpy
+    def run():
+        m = Mesh(vertices=numpy.zeros((2,3)), mode='line', static=False)
+        for i in range(1000):
+            m.update_vertices(len(m.vertices), ((i, 0, 0), ))
+    return run
+
+
+@benchmark('Mesh.generate_normals() sphere', repeat=3)
+def mesh_generate_normals():
+    m = load_model('sphere', application.internal_models_compressed_folder)
+    return m.generate_normals
+
+
+@benchmark('Mesh.generate_normals() 30k flat', repeat=3)
+def mesh_generate_normals_flat():
+    vertices, colors, uvs = _grid_mesh(30_000)
+    m = Mesh(vertices=vertices)
+    return lambda: m.generate_normals(smooth=False)
+
+
+@benchmark('Mesh.weld() 100000 vertices', repeat=3)
+def mesh_weld():
+    import numpy
+    sphere = load_model('sphere', application.internal_models_compressed_folder)
+    vertices = numpy.tile(Mesh._to_array(sphere.vertices, 3), (35, 1))    # ~100k vertices, each shared by several triangles
+    def run():
+        Mesh(vertices=vertices).weld()
+    return run
+
+
+@benchmark('Mesh.generate_lods() 28k triangles', repeat=1)
+def mesh_generate_lods():
+    import numpy
+    size = 120
+    x, z = numpy.meshgrid(numpy.linspace(-1, 1, size), numpy.linspace(-1, 1, size))
+    vertices = numpy.stack([x.ravel(), numpy.sin(x.ravel()*3) * numpy.cos(z.ravel()*2) * .3, z.ravel()], axis=1)
+    i = numpy.arange(size*size).reshape(size, size)
+    a, b, c, d = i[:-1,:-1].ravel(), i[:-1,1:].ravel(), i[1:,1:].ravel(), i[1:,:-1].ravel()
+    m = Mesh(vertices=vertices, triangles=numpy.concatenate([numpy.stack([a,c,b], 1), numpy.stack([a,d,c], 1)]))
+    return lambda: m.generate_lods(cache=False)
+
+
+@benchmark('Mesh.concatenate() 1000 cubes with transforms', repeat=3)
+def mesh_concatenate():
+    from panda3d.core import Mat4
+    cube = load_model('cube', application.internal_models_compressed_folder)
+    meshes = [cube] * 1000
+    transforms = [Mat4.translateMat(i%10, i//100, (i//10)%10) for i in range(1000)]
+    return lambda: Mesh.concatenate(meshes, transforms)
+
+
+@benchmark('combine() 100 cubes', repeat=3)
+def combine_entities():
+    parent = Entity()
+    for i in range(100):
+        Entity(parent=parent, model='cube', x=i%10, z=i//10)
+
+    return lambda: parent.combine(auto_destroy=False)
+
+
+# asset loading
+@benchmark('load_model() cold', repeat=5)
+def load_model_cold():
+    # without the loaded meshes, the asset index or the import cache, like the first time a game starts
+    def run():
+        mesh_importer.imported_meshes.clear()
+        asset_index.indexes.clear()
+        assets.clear()
+        load_model('sphere', application.internal_models_compressed_folder)
+    return run
+
+
+@benchmark('load_model() missing x100, 30k asset files', repeat=3)
+def load_model_missing():
+    path = temporary_folder()
+    for i in range(300):
+        folder = path / f'folder_{i}'
+        folder.mkdir()
+        for j in range(100):
+            (folder / f'asset_{j}.png').touch()
+
+    def run():
+        for i in range(100):
+            load_model(f'missing_model_{i}', path)
+    return run
+
+
+@benchmark('load_model() cached', repeat=100)
+def load_model_cached():
+    load_model('sphere', application.internal_models_compressed_folder)
+    return lambda: load_model('sphere', application.internal_models_compressed_folder)
+
+
+for binary in (True, False):
+    def load_ursinamesh_file(binary=binary):
+        import numpy
+        vertices, colors, uvs = _grid_mesh(100_000)
+        path = temporary_folder() / 'benchmark_mesh.ursinamesh'
+        Mesh(vertices=numpy.array(vertices), colors=numpy.array(colors), uvs=numpy.array(uvs)).save(path.name, path.parent, binary=binary)
+        return lambda: mesh_importer.load_ursinamesh(path)
+
+    benchmark(f'load .ursinamesh 100000 vertices, {"binary" if binary else "text"}', repeat=5 if binary else 1)(load_ursinamesh_file)
+
+
+@benchmark('obj_to_ursinamesh() 10 MB obj', repeat=3, memory_target=64 * 2**20)
+def obj_to_ursinamesh_large():
+    # a grid of quads with uvs, like a scanned model. the memory target is for the peak while parsing and indexing it.
+    import numpy
+    size = 300
+    x, z = numpy.meshgrid(numpy.linspace(-1, 1, size), numpy.linspace(-1, 1, size))
+    vertices = numpy.stack([x.ravel(), numpy.sin(x.ravel()*3) * .3, z.ravel()], axis=1)
+    i = numpy.arange(size*size).reshape(size, size) + 1
+    quads = numpy.stack([i[:-1,:-1].ravel(), i[:-1,1:].ravel(), i[1:,1:].ravel(), i[1:,:-1].ravel()], axis=1)
+
+    path = temporary_folder()
+    with open(path / 'benchmark_mesh.obj', 'w') as file:
+        file.write('o benchmark_mesh\n')
+        file.write(''.join(f'v {x:.6f} {y:.6f} {z:.6f}\n' for x, y, z in vertices.tolist()))
+        file.write(''.join(f'vt {x:.6f} {z:.6f}\n' for x, y, z in vertices.tolist()))
+        file.write('vn 0 1 0\n')
+        file.write(''.join(f'f {a}/{a}/1 {b}/{b}/1 {c}/{c}/1 {d}/{d}/1\n' for a, b, c, d in quads.tolist()))
+
+    return lambda: mesh_importer.obj_to_ursinamesh(path=path, name='benchmark_mesh')
+
+
+@benchmark('load_texture() cold', repeat=5)
+def load_texture_cold():
+    def run():
+        texture_importer.imported_textures.clear()
+        TexturePool.release_all_textures()
+        asset_index.indexes.clear()
+        assets.clear()
+        load_texture('brick')
+    return run
+
+
+@benchmark('load_texture() cached', repeat=100)
+def load_texture_cached():
+    load_texture('brick')
+    return lambda: load_texture('brick')
+
+
+# collision
+for collider_count in (100, 1000):
+    def _make_colliders(collider_count=collider_count):
+        random.seed(0)
+        for i in range(collider_count):
+            Entity(model='cube', collider='box', position=(random.uniform(-50,50), random.uniform(-50,50), random.uniform(5,100)))
+
+    def raycast_colliders(collider_count=collider_count):
+        _make_colliders(collider_count)
+        def run():
+            for i in range(100):
+                raycast(Vec3(0,0,0), Vec3(random.uniform(-.5,.5), random.uniform(-.5,.5), 1), ignore=())
+        return run
+
+    def boxcast_colliders(collider_count=collider_count):
+        _make_colliders(collider_count)
+        def run():
+            for i in range(10):
+                boxcast(Vec3(0,0,0), Vec3(random.uniform(-.5,.5), random.uniform(-.5,.5), 1), thickness=(1,1), ignore=())
+        return run
+
+    benchmark(f'raycast() x100, {collider_count} colliders', repeat=3)(raycast_colliders)
+    benchmark(f'boxcast() x10, {collider_count} colliders', repeat=3)(boxcast_colliders)
+
+
+# text
+@benchmark('Text.text = ... x100', repeat=5)
+def text_assignment():
+    t = Text()
+    def run():
+        for i in range(100):
+            t.text = f'<red>score:<default> {i}'
+    return run
+
+
+# sequences
+@benchmark('Sequence.update() x10000 active', repeat=10)
+def sequence_update():
+    time.dt = 1/60
+    sequences = [Sequence(Wait(1000), Func(print, 'never'), loop=True) for i in range(10000)]
+    for s in sequences:
+        s.start()
+
+    def run():
+        for s in sequences:
+            s.update()
+    return run
@@ -41,7 +41,8 @@ for i, arg in enumerate(sys.argv):
             provided with project folder path, creates a build folder where
             it copies python and project's dependent packages. requires a main.py file.
             copies game scripts and assets into 'build/scr' folder.
-            creates a .bat file to start the game.'''
+            creates a .bat file to start the game.
+            --compress exports .blend files and compresses textures first, in parallel, skipping the ones that are up to date.'''
             )
         )
         sys.exit()
@@ -158,6 +159,13 @@ for name, mod in finder.modules.items():
         copy(filename, dir)
 
 
+if '--compress' in sys.argv:
+    # in its own process, since the process pool would run this script again in its workers on windows
+    print('compressing assets')
+    import subprocess
+    subprocess.run((sys.executable, '-m', 'ursina.assets', '--compress', '--folder', str(project_folder)))
+
+
 print('copying assets')
 for f in project_folder.iterdir():
     name = f.name
@@ -29,8 +29,10 @@ class Camera(Entity):
 
 
     def set_up(self):
-        self.display_region = base.camNode.get_display_region(0)
-        win = self.display_region.get_window()
+        self.display_region = None
+        if not application.headless:
+            self.display_region = base.camNode.get_display_region(0)
+            win = self.display_region.get_window()
 
         self.perspective_lens = PerspectiveLens()
         self.perspective_lens = base.camLens # use panda3d's default for automatic aspect ratio on window resize
@@ -50,8 +52,10 @@ class Camera(Entity):
         self.clip_plane_near = 0.1
         self.clip_plane_far = 10000
 
-        self.ui_display_region = win.make_display_region()
-        self.ui_display_region.set_sort(20)
+        self.ui_display_region = None
+        if not application.headless:
+            self.ui_display_region = win.make_display_region()
+            self.ui_display_region.set_sort(20)
 
         self.ui_camera = NodePath(PandaCamera('ui_camera'))
         self.ui_lens = OrthographicLens()
@@ -64,7 +68,8 @@ class Camera(Entity):
         self.ui_render.set_depth_test(0)
         self.ui_render.set_depth_write(0)
         self.ui_camera.reparent_to(self.ui_render)
-        self.ui_display_region.set_camera(self.ui_camera)
+        if self.ui_display_region:
+            self.ui_display_region.set_camera(self.ui_camera)
         scene.ui_camera = self.ui_camera
 
         self.ui = Entity(eternal=True, name='ui', parent=self.ui_camera, scale=(self.ui_size*.5, self.ui_size*.5))
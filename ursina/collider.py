@@ -1,3 +1,4 @@
+import numpy
 from panda3d.core import CollisionNode, CollisionBox, CollisionSphere, CollisionPolygon
 from panda3d.core import NodePath
 from ursina.vec3 import Vec3
@@ -70,33 +71,41 @@ class MeshCollider(Collider):
         self.node = self.node_path.node()
         self.collision_polygons = list()
 
-        if mesh.triangles:
-            for tri in mesh.triangles:
+        # the mesh can have lists or numpy arrays
+        vertices = mesh.vertices.tolist() if isinstance(mesh.vertices, numpy.ndarray) else mesh.vertices
+        triangles = mesh.triangles
+        if isinstance(triangles, numpy.ndarray):
+            triangles = triangles.reshape(-1, 3).tolist() if triangles.ndim == 1 else triangles.tolist()
+        elif len(triangles) and not hasattr(triangles[0], '__len__'):  # flat list of indices
+            triangles = [triangles[i:i+3] for i in range(0, len(triangles), 3)]
+
+        if len(triangles):
+            for tri in triangles:
                 if len(tri) == 3:
                     poly = CollisionPolygon(
-                        Vec3(mesh.vertices[tri[2]]),
-                        Vec3(mesh.vertices[tri[1]]),
-                        Vec3(mesh.vertices[tri[0]]),
+                        Vec3(*vertices[tri[2]]),
+                        Vec3(*vertices[tri[1]]),
+                        Vec3(*vertices[tri[0]]),
                         )
                     self.collision_polygons.append(poly)
                 elif len(tri) == 4:
                     poly = CollisionPolygon(
-                        Vec3(mesh.vertices[tri[2]]),
-                        Vec3(mesh.vertices[tri[1]]),
-                        Vec3(mesh.vertices[tri[0]]))
+                        Vec3(*vertices[tri[2]]),
+                        Vec3(*vertices[tri[1]]),
+                        Vec3(*vertices[tri[0]]))
                     self.collision_polygons.append(poly)
                     poly = CollisionPolygon(
-                        Vec3(mesh.vertices[tri[0]]),
-                        Vec3(mesh.vertices[tri[3]]),
-                        Vec3(mesh.vertices[tri[2]]))
+                        Vec3(*vertices[tri[0]]),
+                        Vec3(*vertices[tri[3]]),
+                        Vec3(*vertices[tri[2]]))
                     self.collision_polygons.append(poly)
 
         elif mesh.mode == 'triangle':
-            for i in range(0, len(mesh.vertices), 3):
+            for i in range(0, len(vertices), 3):
                 poly = CollisionPolygon(
-                    Vec3(mesh.vertices[i+2]),
-                    Vec3(mesh.vertices[i+1]),
-                    Vec3(mesh.vertices[i]),
+                    Vec3(*vertices[i+2]),
+                    Vec3(*vertices[i+1]),
+                    Vec3(*vertices[i]),
                     )
                 self.collision_polygons.append(poly)
 
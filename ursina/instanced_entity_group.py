@@ -0,0 +1,189 @@
+import numpy
+from panda3d.core import Texture, GeomEnums, OmniBoundingVolume, Mat4
+from ursina.entity import Entity
+from ursina import application
+
+
+def compose_transforms(positions, rotations, scales):
+    # returns the transform matrices, shape (n,3,4), for ursina style positions, rotations (euler angles in degrees) and scales.
+    rx, ry, rz = numpy.radians(rotations).T
+    cx, sx, cy, sy, cz, sz = numpy.cos(rx), numpy.sin(rx), numpy.cos(ry), numpy.sin(ry), numpy.cos(rz), numpy.sin(rz)
+
+    m = numpy.empty((len(positions), 3, 4), dtype=numpy.float32)
+    m[:,0,0] = cy*cz - sy*sx*sz;    m[:,0,1] = cy*sz + sy*sx*cz;    m[:,0,2] = sy*cx
+    m[:,1,0] = -cx*sz;              m[:,1,1] = cx*cz;               m[:,1,2] = -sx
+    m[:,2,0] = -sy*cz - cy*sx*sz;   m[:,2,1] = -sy*sz + cy*sx*cz;   m[:,2,2] = cy*cx
+    m[:,:,:3] *= scales[:,None,:]
+    m[:,:,3] = positions
+    return m
+
+
+class InstancedEntityGroup(Entity):
+    '''
+    Renders the same model many times with a single draw call, using hardware instancing.
+    The instances aren't entities, they're rows in the positions, rotations, scales and colors numpy arrays,
+    relative to the group. Change them and call update_instances(), or pass the new values to it directly.
+    When shaders aren't supported, like with the software renderer or in headless mode, every instance gets its own node instead.
+    '''
+    _setattr_hooks = {'model' : '_set_model'}
+
+    def __init__(self, model='cube', positions=(), rotations=None, scales=None, colors=None, hardware_instancing=None, **kwargs):
+        super().__init__(model=model, **kwargs)
+        if hardware_instancing is None:
+            hardware_instancing = InstancedEntityGroup.supports_hardware_instancing()
+        self.hardware_instancing = hardware_instancing
+        self._instance_nodes = list()
+        self._buffer = None
+
+        self.set_instances(positions, rotations, scales, colors)
+
+
+    @staticmethod
+    def supports_hardware_instancing():
+        if application.headless or not application.base.win or not application.base.win.gsg:
+            return False
+
+        gsg = application.base.win.gsg
+        return gsg.supports_glsl and gsg.supports_geometry_instancing and gsg.supports_buffer_texture
+
+
+    @property
+    def count(self):
+        return len(self.positions)
+
+
+    def set_instances(self, positions, rotations=None, scales=None, colors=None):
+        # replaces all the instances. rotations default to 0, scales to 1 and colors to white.
+        self.positions = numpy.array(positions, dtype=numpy.float32).reshape(-1, 3)
+        count = len(self.positions)
+
+        self.rotations = numpy.zeros((count, 3), dtype=numpy.float32)
+        if rotations is not None:
+            self.rotations[:] = rotations
+
+        self.scales = numpy.ones((count, 3), dtype=numpy.float32)
+        if scales is not None:
+            scales = numpy.array(scales, dtype=numpy.float32)
+            self.scales[:] = scales[:,None] if scales.ndim == 1 else scales   # uniform scale per instance
+
+        self.colors = numpy.ones((count, 4), dtype=numpy.float32)
+        if colors is not None:
+            self.colors[:] = numpy.array(colors, dtype=numpy.float32)
+
+        self._instance_data = numpy.zeros((count, 4, 4), dtype=numpy.float32)    # 3 rows of the transform matrix, then the color
+
+        if self.hardware_instancing:
+            self._buffer = Texture('instance_data')
+            self._buffer.setup_buffer_texture(max(count, 1) * 4, Texture.T_float, Texture.F_rgba32, GeomEnums.UH_dynamic)
+            from ursina.shaders.instancing import instancing_shader
+            self.shader = instancing_shader
+            self.set_shader_input('instance_data', self._buffer)
+            self.setInstanceCount(max(count, 1))    # 0 would mean no instancing
+        else:
+            for node in self._instance_nodes[count:]:
+                node.removeNode()
+            del self._instance_nodes[count:]
+            for i in range(len(self._instance_nodes), count):
+                self._instance_nodes.append(self.attachNewNode('instance'))
+
+        self._setup_model()
+        self.update_instances()
+
+
+    def update_instances(self, indices=None, positions=None, rotations=None, scales=None, colors=None):
+        # updates the instances at indices (a list, numpy array or slice), or all of them if indices is None.
+        # values passed get written to the matching arrays first, so you can do group.update_instances([4,5], positions=[a,b])
+        if indices is None:
+            indices = slice(None)
+        elif not isinstance(indices, slice):
+            indices = numpy.asarray(indices, dtype=numpy.intp)
+
+        for values, name in ((positions, 'positions'), (rotations, 'rotations'), (scales, 'scales'), (colors, 'colors')):
+            if values is not None:
+                values = numpy.array(values, dtype=numpy.float32)
+                if name == 'scales' and values.ndim == 1:
+                    values = values[:,None]     # uniform scale per instance
+                getattr(self, name)[indices] = values
+
+        data = self._instance_data
+        data[indices, :3] = compose_transforms(self.positions[indices], self.rotations[indices], self.scales[indices])
+        data[indices, 3] = self.colors[indices]
+
+        if self.hardware_instancing:
+            buffer = numpy.frombuffer(memoryview(self._buffer.modify_ram_image()), dtype=numpy.float32).reshape(-1, 4, 4)
+            buffer[:len(data)][indices] = data[indices]
+            return
+
+        # panda3d matrices are transposed compared to ours
+        ids = numpy.arange(len(data))[indices]
+        matrices = numpy.zeros((len(ids), 4, 4), dtype=numpy.float32)
+        matrices[:, :3] = data[ids, :3]
+        matrices[:, 3, 3] = 1
+        matrices = matrices.transpose(0, 2, 1).reshape(-1, 16).tolist()
+        colors = data[ids, 3].tolist()
+        for i, matrix, color in zip(ids, matrices, colors):
+            self._instance_nodes[i].setMat(Mat4(*matrix))
+            self._instance_nodes[i].setColorScale(*color)
+
+
+    def _set_color(self, name, value):
+        super()._set_color(name, value)
+        if hasattr(self, '_instance_data') and not self.hardware_instancing:
+            self._inherit_instance_colors()
+
+
+    def _inherit_instance_colors(self):
+        # entities block the parent's color scale on their model, but here it has to multiply with the instance color
+        if self.model and self.color is not None:
+            self.model.clearColorScale()
+            self.model.setColorScale(self.color)
+
+
+    def _set_model(self, name, value):
+        super()._set_model(name, value)
+        if hasattr(self, '_instance_data'):
+            self._setup_model()
+
+
+    def _setup_model(self):
+        if not self.model:
+            return
+
+        if self.hardware_instancing:
+            # the instances are placed in the shader, so the model's own bounds are wrong. always render it instead.
+            self.model.node().setBounds(OmniBoundingVolume())
+            self.model.node().setFinal(True)
+            if self.count == 0:
+                self.model.hide()
+            else:
+                self.model.show()
+            return
+
+        self.model.stash()  # only render the model under the instance nodes
+        self._inherit_instance_colors()
+        for node in self._instance_nodes:
+            node.node().removeAllChildren()
+            self.model.instanceTo(node)
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    import numpy
+    app = Ursina()
+
+    size = 64
+    positions = [(x*1.5, 0, z*1.5) for z in range(size) for x in range(size)]
+    colors = [color.random_color() for e in positions]
+    group = InstancedEntityGroup(model='cube', texture='white_cube', positions=positions, colors=colors, x=-size*.75, z=-size*.75)
+    print('hardware instancing:', group.hardware_instancing, 'instances:', group.count)
+
+    def update():
+        # bob one row of cubes up and down each frame
+        row = int(time.time() * 10) % size
+        indices = numpy.arange(row*size, (row+1)*size)
+        group.positions[indices, 1] = numpy.sin(time.time() * 4 + indices) * .5
+        group.update_instances(indices)
+
+    EditorCamera(rotation_x=30)
+    app.run()
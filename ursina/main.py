@@ -1,15 +1,29 @@
 import time
 from ursina.ursinastuff import *
+from ursina import async_loading
+from panda3d.core import MouseWatcher, ClockObject
+from panda3d.core import Camera as PandaCamera
 import __main__
 
 
 class Ursina(ShowBase):
 
-    def __init__(self):
+    def __init__(self, headless=False):
+        if headless:
+            application.headless = True
+
+        if application.headless:    # run without a window, for servers, tests and batch simulation
+            loadPrcFileData('', 'window-type none')
+            loadPrcFileData('', 'audio-library-name null')
+
         ShowBase.__init__(self)
         application.base = base
+        if application.headless:
+            self._make_headless_camera()
+
         window.late_init()
         time.dt = 0
+        self._fixed_time_accumulator = 0
 
         # camera
         camera._cam = base.camera
@@ -24,9 +38,10 @@ class Ursina(ShowBase):
         self.accept('aspectRatioChanged', window.update_aspect_ratio)
 
         # input
-        base.buttonThrowers[0].node().setButtonDownEvent('buttonDown')
-        base.buttonThrowers[0].node().setButtonUpEvent('buttonUp')
-        base.buttonThrowers[0].node().setButtonRepeatEvent('buttonHold')
+        if not application.headless:
+            base.buttonThrowers[0].node().setButtonDownEvent('buttonDown')
+            base.buttonThrowers[0].node().setButtonUpEvent('buttonUp')
+            base.buttonThrowers[0].node().setButtonRepeatEvent('buttonHold')
         self._input_name_changes = {
             'mouse1' : 'left mouse down',
             'mouse1 up' : 'left mouse up',
@@ -76,6 +91,8 @@ class Ursina(ShowBase):
 
         base.disableMouse()
         mouse._mouse_watcher = base.mouseWatcherNode
+        if application.headless:
+            mouse._mouse_watcher = MouseWatcher()   # not connected to anything, so it never has the mouse
         mouse.enabled = True
         self.mouse = mouse
 
@@ -88,40 +105,123 @@ class Ursina(ShowBase):
         from ursina import HotReloader
         application.hot_reloader = HotReloader(__main__.__file__)
 
-        window.make_editor_gui()
+        if not application.headless:
+            window.make_editor_gui()
+
+
+    def _make_headless_camera(self):
+        # ShowBase doesn't make a camera when there's no window, so make one that isn't connected to a display region.
+        base.camera = base.render.attach_new_node('camera')
+        base.camLens = PerspectiveLens()
+        base.camNode = PandaCamera('cam')
+        base.camNode.set_lens(base.camLens)
+        base.cam = base.camera.attach_new_node(base.camNode)
 
 
     def _update(self, task):
         # time between frames
-        dt = globalClock.getDt() * application.time_scale
+        self._step_frame(globalClock.getDt() * application.time_scale)
+        return Task.cont
+
+
+    def step(self, n=1, dt=1/60):
+        # advance the game n frames with a constant dt, as fast as possible. useful for headless simulation, tests and benchmarks.
+        # steps the task manager with a clock that pretends dt has passed every frame, so panda3d tasks and intervals run too.
+        mode = globalClock.getMode()
+        globalClock.setMode(ClockObject.MNonRealTime)
+        globalClock.setDt(dt)
+        try:
+            for i in range(n):
+                taskMgr.step()
+        finally:
+            globalClock.setMode(mode)
+
+
+    def _step_frame(self, dt):
         time.dt = dt
 
-        mouse.update()
+        with profiler.phase('mouse.update'):
+            mouse.update()
+
+        if async_loading._finished:
+            with profiler.phase('async_loading'):
+                async_loading.update()
+
+        if not scene._callbacks_sorted:
+            scene._sort_callbacks()
+
+        if application.fixed_timestep:
+            self._run_fixed_steps(dt)
+            time.dt = dt
 
         if hasattr(__main__, 'update') and not application.paused:
-            __main__.update()
+            with profiler.phase('__main__.update'):
+                __main__.update()
 
-        for seq in application.sequences:
-            seq.update()
+        if not application.fixed_timestep:
+            with profiler.phase('sequences'):
+                for seq in application.sequences:
+                    seq.update()
 
-        for entity in scene.entities:
-            if entity.enabled == False or entity.ignore:
-                continue
+        with profiler.phase('entities.update'):
+            self._call_entities(scene._update_entities, 'update')
 
-            if application.paused and entity.ignore_paused == False:
-                continue
+        if profiler.enabled:
+            profiler.end_frame()
 
-            if hasattr(entity, 'update'):
-                entity.update()
 
+    def _run_fixed_steps(self, dt):
+        # call fixed_update() and step the sequences a whole number of times, with a constant time.dt.
+        step = application.fixed_timestep
+        self._fixed_time_accumulator += dt
+        time.dt = step
 
-            if hasattr(entity, 'scripts'):
-                for script in entity.scripts:
-                    if script.enabled and hasattr(script, 'update'):
-                        script.update()
+        steps = 0
+        while self._fixed_time_accumulator >= step and steps < application.max_fixed_steps:
+            if hasattr(__main__, 'fixed_update') and not application.paused:
+                with profiler.phase('__main__.fixed_update'):
+                    __main__.fixed_update()
 
+            with profiler.phase('sequences'):
+                for seq in application.sequences:
+                    seq.update()
 
-        return Task.cont
+            with profiler.phase('entities.fixed_update'):
+                self._call_entities(scene._fixed_update_entities, 'fixed_update')
+
+            self._fixed_time_accumulator -= step
+            steps += 1
+
+        if steps == application.max_fixed_steps:   # too far behind, drop the time we can't catch up on
+            self._fixed_time_accumulator %= step
+
+        application.fixed_timestep_alpha = self._fixed_time_accumulator / step
+
+
+    def _call_entities(self, registry, name, *args):
+        # call update()/fixed_update()/input() on the entities in one of scene's callback registries and on their scripts
+        profiling = profiler.enabled
+
+        for entity in tuple(registry):
+            if entity not in registry:  # disabled or destroyed earlier this frame
+                continue
+            if application.paused and entity.ignore_paused == False:
+                continue
+            if name == 'input' and entity.ignore_input:
+                continue
+
+            if hasattr(entity, name):
+                if profiling:
+                    profiler.call('entity', f'{entity.__class__.__name__}.{name}', getattr(entity, name), *args)
+                else:
+                    getattr(entity, name)(*args)
+
+            for script in entity.scripts:
+                if script.enabled and hasattr(script, name):
+                    if profiling:
+                        profiler.call('script', f'{script.__class__.__name__}.{name}', getattr(script, name), *args)
+                    else:
+                        getattr(script, name)(*args)
 
 
     def input_up(self, key):
@@ -159,28 +259,25 @@ class Ursina(ShowBase):
         except: pass
         if not application.paused:
             if hasattr(__main__, 'input'):
-                __main__.input(key)
+                with profiler.phase('__main__.input'):
+                    __main__.input(key)
 
 
-        for entity in scene.entities:
-            if entity.enabled == False or entity.ignore or entity.ignore_input:
-                continue
-            if application.paused and entity.ignore_paused == False:
-                continue
-
-            if hasattr(entity, 'input'):
-                entity.input(key)
+        if not scene._callbacks_sorted:
+            scene._sort_callbacks()
 
-            if hasattr(entity, 'scripts'):
-                for script in entity.scripts:
-                    if script.enabled and hasattr(script, 'input'):
-                        script.input(key)
+        with profiler.phase('entities.input'):
+            self._call_entities(scene._input_entities, 'input', key)
 
 
         try: mouse.input(key)
         except: pass
 
 
+        if key == 'f3' and application.development_mode and hasattr(window, 'profiler_panel'):
+            window.toggle_profiler()
+
+
         if key == 'f12':
             window.ui_parent.enabled = not window.ui_parent.enabled
 
@@ -206,7 +303,7 @@ class Ursina(ShowBase):
 
 
     def run(self):
-        if window.show_ursina_splash:
+        if window.show_ursina_splash and not application.headless:
             from ursina.prefabs import ursina_splash
 
         application.load_settings()
@@ -1,14 +1,18 @@
+import numpy
+import weakref
+from itertools import chain
 from panda3d.core import MeshDrawer, NodePath
-from panda3d.core import GeomVertexData, GeomVertexFormat, Geom, GeomVertexWriter, GeomNode
+from panda3d.core import GeomVertexData, GeomVertexFormat, GeomVertexArrayFormat, Geom, GeomNode, InternalName
 from panda3d.core import GeomTriangles, GeomTristrips, GeomTrifans
 from panda3d.core import GeomLines, GeomLinestrips, GeomPoints
-from panda3d.core import TexGenAttrib, TextureStage
+from panda3d.core import TexGenAttrib, TextureStage, LODNode, PTA_int
 from ursina.vec3 import Vec3
 from ursina.scripts.generate_normals import generate_normals
 from ursina.scripts.project_uvs import project_uvs
 from ursina.scripts.colorize import colorize
 from ursina import color
 from ursina import application
+from ursina import asset_index
 from textwrap import dedent
 from enum import Enum
 from pathlib import Path
@@ -19,6 +23,7 @@ class MeshModes(Enum):
     ngon = 'ngon'
     quad = 'quad'
     line = 'line'
+    lines = 'lines'
     point = 'point'
     tristrip = 'tristrip'
 
@@ -34,24 +39,57 @@ class MeshModes(Enum):
 
 
 
+def _make_vertex_format(colors, uvs, normals):
+    # one float32 array per column instead of interleaving them, so each can be copied in from a numpy array at once
+    vertex_format = GeomVertexFormat()
+    columns = [(InternalName.getVertex(), 3, Geom.C_point)]
+    if colors:
+        columns.append((InternalName.getColor(), 4, Geom.C_color))
+    if uvs:
+        columns.append((InternalName.getTexcoord(), 2, Geom.C_texcoord))
+    if normals:
+        columns.append((InternalName.getNormal(), 3, Geom.C_normal))
+
+    for name, num_components, contents in columns:
+        array_format = GeomVertexArrayFormat()
+        array_format.addColumn(name, num_components, Geom.NT_float32, contents)
+        vertex_format.addArray(array_format)
+
+    return GeomVertexFormat.registerFormat(vertex_format)
+
+
+def _data_property(name):
+    # vertices, colors, uvs and normals. copies of a mesh share them until they're used, see Mesh.__copy__().
+    # then the copy gets its own, so editing them in place doesn't change the other meshes.
+    attr = '_' + name
+    def getter(self):
+        if attr in self._shared or attr in self._as_lists:
+            self._unshare(attr)
+        return getattr(self, attr)
+
+    def setter(self, value):
+        if attr in self._shared or attr in self._as_lists:
+            self._shared = self._shared - {attr}    # no need to copy the one that gets replaced
+            self._as_lists = self._as_lists - {attr}
+        setattr(self, attr, value)
+
+    return property(getter, setter)
+
+
 class Mesh(NodePath):
 
-    _formats = {
-        (0,0,0) : GeomVertexFormat.getV3(),
-        (1,0,0) : GeomVertexFormat.getV3c4(),
-        (0,1,0) : GeomVertexFormat.getV3t2(),
-        (0,0,1) : GeomVertexFormat.getV3n3(),
-        (1,0,1) : GeomVertexFormat.getV3n3c4(),
-        (1,1,0) : GeomVertexFormat.getV3c4t2(),
-        (0,1,1) : GeomVertexFormat.getV3n3t2(),
-        (1,1,1) : GeomVertexFormat.getV3n3c4t2(),
-        }
+    _formats = {(c, u, n) : _make_vertex_format(c, u, n) for c in (0,1) for u in (0,1) for n in (0,1)}    # (colors, uvs, normals) : format
+
+    _data_names = ('_vertices', '_triangles', '_colors', '_uvs', '_normals')
+    _shared = frozenset()   # the ones of _data_names that might also be used by another mesh. they get copied the first time they're used.
+    _as_lists = frozenset() # the numpy arrays of _data_names that get turned into lists the first time they're used. see mesh_importer.numpy_arrays.
 
     _modes = {
         'triangle' : GeomTriangles,
         'tristrip' : GeomTristrips,
         'ngon' : GeomTrifans,
         'line' : GeomLinestrips,
+        'lines' : GeomLines,    # separate line segments, with triangles as pairs of indices
         'point' : GeomPoints,
         }
 
@@ -66,124 +104,460 @@ class Mesh(NodePath):
         self.static = static
         self.mode = mode
         self.thickness = thickness
+        self._recipe = None
+        self._bounds = None     # (min point, max point, center, radius), made when asked for by aabb or bounding_sphere
 
         for var in (('vertices', vertices), ('triangles', triangles), ('colors', colors), ('uvs', uvs), ('normals', normals)):
             name, value = var
             if value is None:
                 setattr(self, name, list())
 
-        if self.vertices:
-            self.vertices = [Vec3(v) for v in self.vertices]
+        # numpy arrays are kept as numpy arrays. lists are still supported, but slower.
+        for name, num_components in (('vertices', 3), ('colors', 4), ('uvs', 2), ('normals', 3)):
+            value = getattr(self, name)
+            if isinstance(value, numpy.ndarray):
+                setattr(self, name, numpy.ascontiguousarray(value, dtype=numpy.float32).reshape(-1, num_components))
+        if isinstance(self._triangles, numpy.ndarray):
+            self._triangles = numpy.ascontiguousarray(self._triangles, dtype=numpy.uint32)
+
+        if len(self.vertices):
+            if not isinstance(self.vertices, numpy.ndarray):
+                self.vertices = [Vec3(v) for v in self.vertices]
             self.generate()
 
 
     def generate(self):  # call this after setting some of the variables to update it
         if hasattr(self, 'geomNode'):
             self.geomNode.removeAllGeoms()
+            lods = self.find('mesh_lods')   # made for the old vertices, so remove them
+            if not lods.isEmpty():
+                lods.removeNode()
 
         static_mode = Geom.UHStatic if self.static else Geom.UHDynamic
-        vertex_format = Mesh._formats[(bool(self.colors), bool(self.uvs), bool(self.normals))]
+        vertices = Mesh._to_array(self._vertices, 3)
+        columns = [Mesh._to_array(values, num_components, len(vertices)) if values is not None and len(values) else None
+            for values, num_components in ((self._colors, 4), (self._uvs, 2), (self._normals, 3))]
+
+        vertex_format = Mesh._formats[tuple(c is not None for c in columns)]
         vdata = GeomVertexData('name', vertex_format, static_mode)
-        vdata.setNumRows(len(self.vertices)) # for speed
+        vdata.uncleanSetNumRows(len(vertices))
+        for i, column in enumerate([vertices] + [c for c in columns if c is not None]):
+            vdata.modifyArrayHandle(i).copyDataFrom(column)    # bulk copy, instead of writing one row at a time
+
         self.geomNode = GeomNode('mesh')
         self.attachNewNode(self.geomNode)
 
-        vertexwriter = GeomVertexWriter(vdata, 'vertex')
-        for v in self.vertices:
-            vertexwriter.addData3f(*v)
-
-        if self.colors:
-            colorwriter = GeomVertexWriter(vdata, 'color')
-            for c in self.colors:
-                colorwriter.addData4f(c)
-
-        if self.uvs:
-            uvwriter = GeomVertexWriter(vdata, 'texcoord')
-            for uv in self.uvs:
-                uvwriter.addData2f(uv[0], uv[1])
-
-        if self.normals != None:
-            normalwriter = GeomVertexWriter(vdata, 'normal')
-            for norm in self.normals:
-                normalwriter.addData3f(*norm)
-
-
-        if self.mode != 'line' or not self._triangles:
-            prim = Mesh._modes[self.mode](static_mode)
-
-            if self._triangles:
-                if isinstance(self._triangles[0], int):
-                    for t in self._triangles:
-                        prim.addVertex(t)
-
-                elif len(self._triangles[0]) >= 3: # if tris are tuples like this: ((0,1,2), (1,2,3))
-                    for t in self._triangles:
-                        if len(t) == 3:
-                            for e in t:
-                                prim.addVertex(e)
-                        elif len(t) == 4: # turn quad into tris
-                            prim.addVertex(t[0])
-                            prim.addVertex(t[1])
-                            prim.addVertex(t[2])
-                            prim.addVertex(t[2])
-                            prim.addVertex(t[3])
-                            prim.addVertex(t[0])
-
-            else:
-                prim.addConsecutiveVertices(0, len(self.vertices))
+        has_triangles = self._triangles is not None and len(self._triangles)
+        index_type, index_dtype = (Geom.NT_uint16, numpy.uint16) if len(vertices) < 65535 else (Geom.NT_uint32, numpy.uint32)
+        prim = Mesh._modes[self.mode](static_mode)
+
+        if has_triangles and self.mode == 'line':
+            # all the lines in one primitive, separated by the strip cut index, so they're drawn with a single geom
+            prim.setIndexType(index_type)
+            indices, ends = Mesh._lines_to_indices(self._triangles, prim.getStripCutIndex())
+            prim.modifyVertices().modifyHandle().copyDataFrom(indices.astype(index_dtype))
+            prim.setEnds(PTA_int(ends))
+
+        elif has_triangles:
+            indices = Mesh._triangles_to_indices(self._triangles)
+            if len(indices):
+                prim.setIndexType(index_type)
+                prim.modifyVertices().modifyHandle().copyDataFrom(indices.astype(index_dtype))
+            prim.close_primitive()
 
+        else:
+            prim.addConsecutiveVertices(0, len(vertices))
             prim.close_primitive()
-            geom = Geom(vdata)
-            geom.addPrimitive(prim)
-            self.geomNode.addGeom(geom)
-
-        else:   # line with segments defined in triangles
-            for line in self._triangles:
-                prim = Mesh._modes[self.mode](static_mode)
-                for e in line:
-                    prim.addVertex(e)
-                prim.close_primitive()
-                geom = Geom(vdata)
-                geom.addPrimitive(prim)
-                self.geomNode.addGeom(geom)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(prim)
+        self.geomNode.addGeom(geom)
 
         if self.mode == 'point':
             self.setTexGen(TextureStage.getDefault(), TexGenAttrib.MPointSprite)
             # self.set_render_mode_perspective(True)
 
 
-        self.recipe = dedent(f'''
+        self._recipe = None
+        self._bounds = None
+        # print('finished')
+
+
+    def to_dict(self):
+        # the arguments to recreate the mesh with Mesh(**mesh.to_dict()), as lists and numbers, so it can be stored without building a string
+        return dict(
+            vertices=Mesh._to_list(self._vertices),
+            triangles=self._triangles.tolist() if isinstance(self._triangles, numpy.ndarray) else list(self._triangles),
+            colors=Mesh._to_list(self._colors),
+            uvs=self._uvs.tolist() if isinstance(self._uvs, numpy.ndarray) else list(self._uvs),
+            normals=Mesh._to_list(self._normals),
+            static=self.static,
+            mode=self.mode.value if isinstance(self.mode, MeshModes) else self.mode,
+            thickness=self.thickness,
+            )
+
+
+    @property
+    def recipe(self):
+        # python code that recreates the mesh. only made when asked for, since it's as slow as generating the mesh for big meshes.
+        if self._recipe is not None:
+            return self._recipe
+
+        data = self.to_dict()
+        return dedent(f'''
             Mesh(
-                vertices={[tuple(e) for e in self.vertices]},
-                triangles={self._triangles},
-                colors={[tuple(e) for e in self.colors]},
-                uvs={self.uvs},
-                normals={[tuple(e) for e in self.normals]},
-                static={self.static},
-                mode="{self.mode}",
-                thickness={self.thickness}
+                vertices={data['vertices']},
+                triangles={data['triangles']},
+                colors={data['colors']},
+                uvs={data['uvs']},
+                normals={data['normals']},
+                static={data['static']},
+                mode="{data['mode']}",
+                thickness={data['thickness']}
             )
         ''')
-        # print('finished')
+
+    @recipe.setter
+    def recipe(self, value):    # overrides the generated recipe until the next generate()
+        self._recipe = value
+
+
+    _columns = {'vertices' : ('vertex', 3), 'colors' : ('color', 4), 'uvs' : ('texcoord', 2), 'normals' : ('normal', 3)}
+
+    def update_vertices(self, start, values):
+        # writes values to self.vertices[start:] and to the existing vertex data, without regenerating the mesh.
+        # writing past the end adds vertices, and makes room for more, so appending every frame doesn't reallocate every time.
+        self._update_column('vertices', start, values)
+
+    def update_colors(self, start, values):
+        self._update_column('colors', start, values)
+
+    def update_uvs(self, start, values):
+        self._update_column('uvs', start, values)
+
+    def update_normals(self, start, values):
+        self._update_column('normals', start, values)
+
+
+    def reserve(self, vertex_count):
+        # make room for vertex_count vertices ahead of time, for meshes that will grow
+        for name in Mesh._columns:
+            if isinstance(getattr(self, name), numpy.ndarray):
+                self._grow_array(name, len(getattr(self, name)), capacity=vertex_count)
+
+        if hasattr(self, 'geomNode'):
+            vdata = self.geomNode.modifyGeom(0).modifyVertexData()
+            if vdata.getNumRows() < vertex_count:
+                vdata.setNumRows(vertex_count)
+
+
+    def _grow_array(self, name, length, capacity=None):
+        # returns getattr(self, name) resized to length. numpy arrays get extra capacity and become a view of a bigger buffer.
+        array = getattr(self, name)
+        if length <= len(array) and capacity is None:
+            return array
+
+        if not hasattr(self, '_buffers'):
+            self._buffers = dict()
+        buffer = self._buffers.get(name)
+        if buffer is None or array.base is not buffer or len(buffer) < max(length, capacity or 0):
+            capacity = max(length, capacity or len(array) * 2)
+            buffer = numpy.zeros((capacity, array.shape[1]), dtype=numpy.float32)
+            buffer[:len(array)] = array
+            self._buffers[name] = buffer
+
+        array = buffer[:length]
+        setattr(self, name, array)
+        return array
+
+
+    def _update_column(self, name, start, values):
+        column_name, num_components = Mesh._columns[name]
+        values = Mesh._to_array(values, num_components)
+        end = start + len(values)
+        if start > len(getattr(self, name)):
+            raise IndexError(f'start ({start}) is past the end of {name} ({len(getattr(self, name))})')
+
+        current = getattr(self, name)
+        if name == 'vertices':
+            self._bounds = None
+        if isinstance(current, numpy.ndarray):
+            self._grow_array(name, end)[start:end] = values
+        elif name == 'vertices':
+            current[start:end] = [Vec3(*v) for v in values.tolist()]
+        else:
+            current[start:end] = [tuple(v) for v in values.tolist()]
+
+        # a mesh that hasn't been generated yet, or a new column, needs a full generate(). otherwise there's a single geom, lines included.
+        if not hasattr(self, 'geomNode'):
+            return self.generate()
+        geom = self.geomNode.modifyGeom(0)
+        vdata = geom.modifyVertexData()
+        array_index = vdata.getFormat().getArrayWith(InternalName.make(column_name))
+        if array_index == -1:
+            return self.generate()
+
+        if end > vdata.getNumRows():
+            vdata.setNumRows(max(end, vdata.getNumRows() * 2))
+
+        stride = num_components * 4
+        vdata.modifyArrayHandle(array_index).copySubdataFrom(start * stride, len(values) * stride, values, 0, len(values) * stride)
+
+        # without triangles, draw all the vertices in order, but not the spare capacity
+        if name == 'vertices' and not (self._triangles is not None and len(self._triangles)):
+            prim = geom.modifyPrimitive(0)
+            vertex_count = len(self.vertices)
+            if prim.getNumVerticesPerPrimitive():   # triangles and points, as opposed to strips and fans
+                vertex_count -= vertex_count % prim.getNumVerticesPerPrimitive()
+            if prim.getNumVertices() != vertex_count:
+                prim.clearVertices()
+                prim.addConsecutiveVertices(0, vertex_count)
+                prim.closePrimitive()
+
+    @staticmethod
+    def _to_array(values, num_components, num_rows=None):
+        # returns values as a contiguous float32 numpy array with shape (num_rows, num_components)
+        if isinstance(values, numpy.ndarray):
+            array = numpy.ascontiguousarray(values, dtype=numpy.float32).reshape(-1, num_components)
+        elif len(values) and len(values[0]) == num_components:
+            array = numpy.fromiter(chain.from_iterable(values), numpy.float32, len(values) * num_components).reshape(-1, num_components)
+        else:   # like uvs with more than two components
+            array = numpy.array([tuple(e)[:num_components] for e in values], dtype=numpy.float32).reshape(-1, num_components)
+
+        if num_rows is not None and len(array) != num_rows:    # ignore extra values, leave missing ones at 0
+            resized = numpy.zeros((num_rows, num_components), dtype=numpy.float32)
+            resized[:min(num_rows, len(array))] = array[:num_rows]
+            array = resized
+
+        return array
+
+
+    @staticmethod
+    def _triangles_to_indices(triangles):
+        # flattens triangles given as a flat list, as tuples of 3 or as quads (split into two triangles) into an index array.
+        # pairs are kept as they are, for mode='lines'.
+        if not isinstance(triangles, numpy.ndarray):
+            if not hasattr(triangles[0], '__len__'):
+                return numpy.fromiter(triangles, numpy.uint32, len(triangles))
+
+            lengths = set(map(len, triangles))
+            if len(lengths) == 1 and lengths.pop() in (2, 3, 4):
+                width = len(triangles[0])
+                triangles = numpy.fromiter(chain.from_iterable(triangles), numpy.uint32, len(triangles) * width).reshape(-1, width)
+            else:
+                indices = list()
+                for t in triangles:
+                    if len(t) == 3:
+                        indices.extend(t)
+                    elif len(t) == 4: # turn quad into tris
+                        indices.extend((t[0], t[1], t[2], t[2], t[3], t[0]))
+                return numpy.array(indices, dtype=numpy.uint32)
+
+        if triangles.ndim == 1:
+            return triangles.astype(numpy.uint32)
+        if triangles.shape[1] in (2, 3):
+            return triangles.astype(numpy.uint32).ravel()
+        if triangles.shape[1] == 4:
+            return triangles[:, (0,1,2,2,3,0)].astype(numpy.uint32).ravel()
+
+        return numpy.zeros(0, dtype=numpy.uint32)
+
+
+    @staticmethod
+    def _lines_to_indices(lines, strip_cut_index):
+        # returns the indices of all the lines, separated by strip_cut_index, and the ends of each line, for a GeomLinestrips
+        if isinstance(lines, numpy.ndarray) and lines.ndim == 2:
+            lengths = numpy.full(len(lines), lines.shape[1])
+            flat = lines.ravel()
+        elif not hasattr(lines[0], '__len__'):  # a single line
+            lengths = numpy.array([len(lines)])
+            flat = numpy.asarray(lines)
+        else:
+            lengths = numpy.fromiter(map(len, lines), numpy.int64, len(lines))
+            flat = numpy.fromiter(chain.from_iterable(lines), numpy.int64, int(lengths.sum()))
+
+        ends = numpy.cumsum(lengths + 1, dtype=numpy.int32) - 1
+        indices = numpy.full(len(flat) + len(lengths) - 1, strip_cut_index, dtype=numpy.int64)
+        indices[numpy.arange(len(flat)) + numpy.repeat(numpy.arange(len(lengths)), lengths)] = flat
+        return indices, ends
+
+
+    @staticmethod
+    def _to_list(values):
+        if isinstance(values, numpy.ndarray):
+            return [tuple(e) for e in values.tolist()]
+        return [tuple(e) for e in values]
+
 
     def __add__(self, other):
-        self.vertices += other.vertices
-        self.triangles += other.triangles
-        if other.colors:
-            self.colors += other.colors
+        return Mesh.concatenate((self, other))
+
+
+    @staticmethod
+    def concatenate(meshes, transforms=None, colors=None):
+        '''
+        Returns a new mesh with all the meshes in it, for example to draw many static objects with a single draw call.
+        transforms is an optional Mat4 or 4x4 array for each mesh, which gets baked into its vertices and normals.
+        colors is an optional color for each mesh, used for the meshes without vertex colors. Those are white otherwise.
+        Missing uvs and normals are filled with zeros. The meshes must have the same mode.
+        '''
+        meshes = list(meshes)
+        if not meshes:
+            return Mesh()
+        mode = meshes[0].mode
+        if any(m.mode != mode for m in meshes):
+            raise ValueError('can\'t concatenate meshes with different modes')
+        if mode in ('tristrip', 'ngon'):
+            raise ValueError(f'can\'t concatenate meshes with mode {mode}')
+
+        # copies of a model share their lists and arrays, so only convert each one once
+        converted = dict()
+        def to_array(values, *args, convert=Mesh._to_array):
+            key = (id(values), convert, *args)
+            if key not in converted:
+                converted[key] = convert(values, *args)
+            return converted[key]
+
+        counts = numpy.array([len(m._vertices) for m in meshes], dtype=numpy.int64)
+        offsets = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+        vertices = numpy.concatenate([to_array(m._vertices, 3) for m in meshes]) if counts.sum() else numpy.zeros((0,3), dtype=numpy.float32)
+
+        columns = dict()
+        for name, num_components, default in (('colors', 4, (1,1,1,1)), ('uvs', 2, (0,0)), ('normals', 3, (0,0,0))):
+            if not any(len(getattr(m, f'_{name}')) for m in meshes) and not (name == 'colors' and colors is not None):
+                continue
+            parts = list()
+            for i, (m, count) in enumerate(zip(meshes, counts)):
+                values = getattr(m, f'_{name}')
+                if len(values):
+                    parts.append(to_array(values, num_components, count))
+                else:
+                    value = colors[i] if name == 'colors' and colors is not None else default
+                    parts.append(numpy.broadcast_to(numpy.array(tuple(value)[:num_components], dtype=numpy.float32), (count, num_components)))
+            columns[name] = numpy.concatenate(parts)
+
+        if transforms is not None:
+            # every vertex gets the matrix of its mesh, so they're all transformed at once. panda3d matrices multiply row vectors.
+            matrices = numpy.array([numpy.identity(4) if t is None else numpy.array(t, dtype=numpy.float64).reshape(4,4) for t in transforms], dtype=numpy.float32)
+            owner = numpy.repeat(numpy.arange(len(meshes)), counts)
+            vertices = numpy.einsum('ni,nij->nj', vertices, matrices[owner, :3, :3]) + matrices[owner, 3, :3]
+            if 'normals' in columns:
+                normal_matrices = numpy.linalg.inv(matrices[:, :3, :3]).transpose(0, 2, 1).astype(numpy.float32)
+                normals = numpy.einsum('ni,nij->nj', columns['normals'], normal_matrices[owner])
+                columns['normals'] = normals / numpy.maximum(numpy.linalg.norm(normals, axis=1), 1e-12)[:,None]
+
+        if mode == 'line':
+            # one line per mesh without triangles, since those are drawn as a single line
+            triangles = list()
+            for m, offset, count in zip(meshes, offsets.tolist(), counts.tolist()):
+                lines = m._triangles
+                if lines is None or not len(lines):
+                    triangles.append(tuple(range(offset, offset + count)))
+                elif isinstance(lines, numpy.ndarray) and lines.ndim == 2:
+                    triangles.extend(map(tuple, (lines.astype(numpy.int64) + offset).tolist()))
+                elif not hasattr(lines[0], '__len__'):
+                    triangles.append(tuple(int(e) + offset for e in lines))
+                else:
+                    triangles.extend(tuple(int(e) + offset for e in line) for line in lines)
+
+        elif all(m._triangles is None or not len(m._triangles) for m in meshes):
+            triangles = None    # the vertices are drawn in order, which is still right after putting them after each other
+
         else:
-            self.colors += (color.white, ) * len(other.vertices)
+            triangles = numpy.concatenate([
+                (to_array(m._triangles, convert=Mesh._triangles_to_indices) if m._triangles is not None and len(m._triangles) else numpy.arange(count, dtype=numpy.uint32)) + numpy.uint32(offset)
+                for m, offset, count in zip(meshes, offsets.tolist(), counts.tolist())
+                ])
+            width = {'triangle' : 3, 'lines' : 2}.get(mode)
+            if width and len(triangles) % width == 0:
+                triangles = triangles.reshape(-1, width)
 
-        self.normals += other.normals
-        self.uvs += other.uvs
+        return Mesh(vertices=vertices, triangles=triangles, mode=mode, static=meshes[0].static, thickness=meshes[0].thickness, **columns)
 
 
     def __copy__(self):
-        m = Mesh(self.vertices, self.triangles, self.colors, self.uvs, self.normals, self.static, self.mode, self.thickness)
+        # the copy shares the vertex data with this mesh, on the gpu too, instead of generating it again.
+        # each of the python side lists and arrays gets copied when it's first used, and panda3d copies the geoms when they get modified.
+        m = Mesh.__new__(Mesh)
+        NodePath.__init__(m, 'mesh')
+        for name in Mesh._data_names + ('static', 'mode', '_recipe', '_bounds'):
+            m.__dict__[name] = self.__dict__[name]
+        self._shared = m._shared = frozenset(Mesh._data_names)
+        m._as_lists = self._as_lists
+
+        m.node().setState(self.node().getState())   # thickness, and texgen for points
+        if hasattr(self, 'geomNode'):
+            m.geomNode = GeomNode('mesh')
+            m.geomNode.addGeomsFrom(self.geomNode)
+            m.attachNewNode(m.geomNode)
         m.name = self.name
         return m
 
 
+    def _unshare(self, *names):
+        # gives this mesh its own copy of the shared data in names, or of all of it. the arrays in _as_lists get copied to lists instead.
+        names = names or tuple(self._shared | self._as_lists)
+        as_lists = self._as_lists.intersection(names)
+        self._shared = self._shared.difference(names)
+        self._as_lists = self._as_lists.difference(names)
+        for name in names:
+            value = getattr(self, name)
+            if isinstance(value, numpy.ndarray) and name in as_lists:
+                if name == '_vertices':
+                    setattr(self, name, [Vec3(*v) for v in value.tolist()])
+                else:
+                    setattr(self, name, [tuple(e) for e in value.tolist()] if value.ndim > 1 else value.tolist())
+            elif isinstance(value, numpy.ndarray):
+                setattr(self, name, value.copy())
+            elif name == '_vertices':
+                setattr(self, name, [Vec3(*v) for v in value])
+            elif name == '_triangles' and value is not None:
+                setattr(self, name, [list(e) if isinstance(e, list) else e for e in value])   # line segments can be lists
+            elif value is not None:
+                setattr(self, name, list(value))
+
+
+    def _clone_wrapper(self, node_path, geom_node_index):
+        # wrap a copy of this mesh's node made with copyTo(), without generating it again. used by Entity.spawn_many().
+        m = Mesh.__new__(Mesh)
+        NodePath.__init__(m, node_path)
+        m.__dict__.update(self.__dict__)
+        self._shared = m._shared = frozenset(Mesh._data_names)   # so editing one copy won't change the others
+        m.__dict__.pop('_buffers', None)
+
+        if geom_node_index == -1:   # moved under the LODNode by set_lod_distances()
+            m.geomNode = node_path.find('mesh_lods').getChild(0).node()
+        else:
+            m.geomNode = node_path.getChild(geom_node_index).node()
+        return m
+
+
+    @property
+    def aabb(self):
+        # the axis aligned bounding box of the vertices as (min point, max point). cached until the mesh changes with generate() or update_vertices().
+        if self._bounds is None:
+            self._calculate_bounds()
+        return Vec3(*self._bounds[0]), Vec3(*self._bounds[1])
+
+    @property
+    def bounding_sphere(self):
+        # (center, radius) of a sphere containing all the vertices. centered on the aabb, so not always the smallest one.
+        if self._bounds is None:
+            self._calculate_bounds()
+        return Vec3(*self._bounds[2]), self._bounds[3]
+
+    def _calculate_bounds(self):
+        vertices = Mesh._to_array(self._vertices, 3)
+        if not len(vertices):
+            self._bounds = ((0,0,0), (0,0,0), (0,0,0), 0)
+            return
+
+        min_point, max_point = vertices.min(axis=0), vertices.max(axis=0)
+        center = (min_point + max_point) / 2
+        radius = float(numpy.sqrt(numpy.max(numpy.sum((vertices - center) ** 2, axis=1))))
+        self._bounds = (min_point.tolist(), max_point.tolist(), center.tolist(), radius)
+
+
     @property
     def thickness(self):
         return self.getRenderModeThickness()
@@ -192,24 +566,166 @@ class Mesh(NodePath):
     def thickness(self, value):
         self.setRenderModeThickness(value)
 
+    vertices = _data_property('vertices')
+    colors = _data_property('colors')
+    uvs = _data_property('uvs')
+    normals = _data_property('normals')
+
     @property
     def triangles(self):
-        if self._triangles == None:
+        if '_triangles' in self._shared or '_triangles' in self._as_lists:
+            self._unshare('_triangles')
+        if self._triangles is None:
             self._triangles = [(i, i+1, i+2) for i in range(0, len(self.vertices), 3)]
 
         return self._triangles
 
     @triangles.setter
     def triangles(self, value):
+        if '_triangles' in self._shared or '_triangles' in self._as_lists:
+            self._shared = self._shared - {'_triangles'}
+            self._as_lists = self._as_lists - {'_triangles'}
         self._triangles = value
 
 
     def generate_normals(self, smooth=True):
-        self.normals = list(generate_normals(self.vertices, self.triangles, smooth))
+        self.normals = list(generate_normals(self._vertices, self.triangles, smooth))
         self.generate()
         return self.normals
 
 
+    def weld(self, tolerance=1e-5):
+        # merges vertices with the same position, color, uv and normal, and makes the mesh indexed, so a triangle soup shares its vertices.
+        # values get rounded to a grid of size tolerance, so vertices closer than that, but on different sides of a grid line, stay separate.
+        vertices = Mesh._to_array(self._vertices, 3)
+        columns = {name : Mesh._to_array(getattr(self, '_' + name), num_components, len(vertices))
+            for name, (_, num_components) in Mesh._columns.items() if name != 'vertices' and len(getattr(self, '_' + name))}
+
+        keys = numpy.hstack([vertices] + list(columns.values()))
+        if tolerance:
+            keys = numpy.round(keys / tolerance)
+        _, first, inverse = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+        # number the unique vertices in the order they first appear in, so the mesh stays recognizable
+        order = numpy.argsort(first)
+        new_index = numpy.empty(len(order), dtype=numpy.uint32)
+        new_index[order] = numpy.arange(len(order), dtype=numpy.uint32)
+        new_index = new_index[inverse.ravel()]
+        kept = first[order]
+
+        triangles = self._triangles
+        if triangles is None or not len(triangles):
+            triangles = new_index
+            if self.mode == 'line':
+                triangles = [triangles.tolist()]
+        elif isinstance(triangles, numpy.ndarray):
+            triangles = new_index[triangles]
+        elif not hasattr(triangles[0], '__len__'):
+            triangles = new_index[numpy.array(triangles)]
+        else:   # triangles, quads or lines as tuples
+            triangles = [tuple(new_index[list(t)].tolist()) for t in triangles]
+
+        if isinstance(triangles, numpy.ndarray) and triangles.ndim == 1 and self.mode == 'triangle' and len(triangles) % 3 == 0:
+            triangles = triangles.reshape(-1, 3)
+
+        if isinstance(self._vertices, numpy.ndarray) and '_vertices' not in self._as_lists:
+            self.vertices = vertices[kept]
+            for name, values in columns.items():
+                setattr(self, name, values[kept])
+            self.triangles = triangles
+        else:   # keep lists as lists
+            self.vertices = [Vec3(*v) for v in vertices[kept].tolist()]
+            for name, values in columns.items():
+                setattr(self, name, Mesh._to_list(values[kept]))
+            self.triangles = triangles.tolist() if isinstance(triangles, numpy.ndarray) else triangles
+
+        self.generate()
+        return self
+
+
+    _lod_cache = weakref.WeakValueDictionary()    # (hash of the mesh, ratio) : Mesh, shared by the meshes with the same content while any of them uses it
+
+    def generate_lods(self, ratios=(1, .5, .25, .1), cache=True):
+        # returns simplified versions of the mesh with about ratio of the triangles each, made by collapsing edges with quadric error metrics.
+        # with cache=True they get saved as .ursinamesh files in compressed_models_folder, so they don't have to be made again next time.
+        from hashlib import md5
+        from ursina.scripts.simplify_mesh import simplify_mesh_lods
+        from ursina.mesh_importer import save_binary_ursinamesh, load_binary_ursinamesh
+
+        if self.mode != 'triangle':
+            print('generate_lods() only works with triangle meshes, not:', self.mode)
+            return [self for ratio in ratios]
+
+        vertices = Mesh._to_array(self._vertices, 3)
+        has_triangles = self._triangles is not None and len(self._triangles)
+        triangles = Mesh._triangles_to_indices(self._triangles) if has_triangles else numpy.arange(len(vertices), dtype=numpy.uint32)
+        columns = {name : Mesh._to_array(getattr(self, '_' + name), num_components, len(vertices))
+            for name, (_, num_components) in Mesh._columns.items() if name != 'vertices' and len(getattr(self, '_' + name))}
+
+        digest = md5(vertices.tobytes())
+        for array in [triangles] + list(columns.values()):
+            digest.update(array.tobytes())
+        digest = digest.hexdigest()[:12]
+        cache_path = lambda ratio: application.compressed_models_folder / f'{self.name}_lod_{ratio}_{digest}.ursinamesh'
+
+        lods = dict()   # ratio : Mesh
+        for ratio in ratios:
+            if ratio >= 1:
+                lods[ratio] = self
+            elif (digest, ratio) in Mesh._lod_cache:
+                lods[ratio] = Mesh._lod_cache[(digest, ratio)]
+            elif cache and cache_path(ratio).exists():
+                lods[ratio] = load_binary_ursinamesh(cache_path(ratio))
+
+        missing = [ratio for ratio in ratios if ratio not in lods]
+        if missing:
+            welded = Mesh(vertices=vertices, triangles=triangles.reshape(-1, 3), static=self.static, **columns).weld()
+            for ratio, (kept, lod_triangles) in zip(missing, simplify_mesh_lods(welded.vertices, welded.triangles, missing)):
+                lods[ratio] = Mesh(
+                    vertices=welded.vertices[kept],
+                    triangles=lod_triangles,
+                    static=self.static,
+                    **{name : getattr(welded, name)[kept] for name in columns}
+                    )
+                if cache:
+                    application.compressed_models_folder.mkdir(exist_ok=True)
+                    save_binary_ursinamesh(lods[ratio], cache_path(ratio))
+
+        for ratio in ratios:
+            if ratio < 1:
+                Mesh._lod_cache[(digest, ratio)] = lods[ratio]
+
+        return [lods[ratio] for ratio in ratios]
+
+
+    def set_lod_distances(self, distances, ratios=None):
+        # show simplified versions of the mesh further away from the camera, using a LODNode. each distance is where a level ends.
+        # the last level is shown beyond the last distance. ratios default to (1, .5, .25, .1), halving from there for more levels.
+        lods = self.find('mesh_lods')
+        if not lods.isEmpty():
+            lods.removeNode()
+            self.attachNewNode(self.geomNode)
+        self._lod_meshes = list()   # keeps them in Mesh._lod_cache while this uses them
+
+        if not distances:
+            return
+
+        if ratios is None:
+            ratios = [(1, .5, .25, .1)[i] if i < 4 else .1 * .5**(i-3) for i in range(len(distances)+1)]
+        meshes = self.generate_lods(ratios)
+        self._lod_meshes = [mesh for mesh in meshes if mesh is not self]
+
+        lod_node = LODNode('mesh_lods')
+        lods = self.attachNewNode(lod_node)
+        self.node().removeChild(self.geomNode)
+        near = 0
+        for i, mesh in enumerate(meshes):
+            far = distances[i] if i < len(distances) else 1e9
+            lods.attachNewNode(mesh.geomNode)
+            lod_node.addSwitch(far, near)
+            near = far
+
+
     def colorize(self, left=color.white, right=color.blue, down=color.red, up=color.green, back=color.white, forward=color.white, smooth=True, world_space=True):
         colorize(self, left, right, down, up, back, forward, smooth, world_space)
 
@@ -224,7 +740,7 @@ class Mesh(NodePath):
             self.generate()
 
 
-    def save(self, name='', path=application.compressed_models_folder):
+    def save(self, name='', path=application.compressed_models_folder, binary=False):   # binary=True saves .ursinamesh in the binary format, which loads a lot faster
         if not application.compressed_models_folder.exists():
             application.compressed_models_folder.mkdir()
 
@@ -234,19 +750,25 @@ class Mesh(NodePath):
                 name += '.ursinamesh'
 
         if name.endswith('ursinamesh'):
-            with open(path / name, 'w') as f:
-                recipe = self.recipe.replace('LVector3f', '')
-                f.write(recipe)
+            if binary:
+                from ursina.mesh_importer import save_binary_ursinamesh
+                save_binary_ursinamesh(self, path / name)
+            else:
+                with open(path / name, 'w') as f:
+                    recipe = self.recipe.replace('LVector3f', '')
+                    f.write(recipe)
             print('saved .ursinamesh to:', path / name)
 
         elif name.endswith('.obj'):
             from ursina.mesh_importer import ursina_mesh_to_obj
-            ursina_mesh_to_obj(self, name, path)
+            ursina_mesh_to_obj(self, name[:-len('.obj')], path)
 
         elif name.endswith('.bam'):
             success = self.writeBamFile(path / name)
             print('saved .bam to:', path / name)
 
+        asset_index.invalidate(path)
+
 
 
 
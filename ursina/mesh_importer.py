@@ -1,14 +1,20 @@
 import os
 import glob
+import json
+import numpy
 import platform
 import subprocess
 from copy import copy
 from pathlib import Path
 from ursina.mesh import Mesh
+from ursina.vec3 import Vec3    # used in some text .ursinamesh files
 from ursina import application
+from ursina import asset_index
+from ursina import assets
 from panda3d.core import CullFaceAttrib
 
 imported_meshes = dict()
+numpy_arrays = False    # keep the numpy arrays of binary and cached models instead of turning them into lists when they're first used. the arrays don't have append(), and + adds them up.
 
 def load_model(name, path=application.asset_folder):
     if name in imported_meshes:
@@ -19,20 +25,19 @@ def load_model(name, path=application.asset_folder):
             pass
 
     for filetype in ('.bam', '.ursinamesh', '.obj', '.blend'):
-        # warning: glob is case-insensitive on windows, so m.path will be all lowercase
-        for filename in path.glob(f'**/{name}{filetype}'):
+        # the index is case-insensitive on windows, like glob, but keeps the real file names
+        for filename in asset_index.find(path, f'{name}{filetype}'):
             if filetype in '.bam':
                 print('loading bam')
                 return loader.loadModel(filename)
 
             if filetype == '.ursinamesh':
                 try:
-                    with open(filename) as f:
-                        m = eval(f.read())
-                        m.path = filename
-                        m.name = name
-                        imported_meshes[name] = m
-                        return m
+                    m = import_model_file(filename)
+                    m.path = filename
+                    m.name = name
+                    imported_meshes[name] = m
+                    return copy(m)  # shares the vertex data, but keeps the cached one unchanged
                 except:
                     print('invalid ursinamesh file:', filename)
 
@@ -41,23 +46,77 @@ def load_model(name, path=application.asset_folder):
                 # print('found obj', filename)
                 # m = loader.loadModel(filename)
                 # m.setAttrib(CullFaceAttrib.make(CullFaceAttrib.MCullCounterClockwise))
-                m = obj_to_ursinamesh(path=path, name=name, return_mesh=True)
+                m = import_model_file(filename)
+                if m is None:
+                    continue
                 m.path = filename
                 m.name = name
                 imported_meshes[name] = m
-                return m
+                return copy(m)
 
             elif filetype == '.blend':
                 print('found blend file:', filename)
-                if compress_models(path=path, name=name):
-                    # obj_to_ursinamesh(name=name)
-                    return load_model(name, path)
+                m = import_model_file(filename)
+                if m is not None:
+                    m.path = filename
+                    m.name = name
+                    imported_meshes[name] = m
+                    return copy(m)
 
             # else:
 
     return None
 
 
+def import_model_file(filename):
+    # loads a .ursinamesh, .obj or .blend file as a Mesh. the result of converting .obj, .blend and text .ursinamesh files gets cached, see ursina.assets.
+    data = read_model_file(filename)
+    if data is None:
+        return None
+    return mesh_from_data(data)
+
+
+def read_model_file(filename):
+    # like import_model_file(), but returns the arguments for Mesh(), so it can run on another thread. see ursina.async_loading.
+    filename = Path(filename)
+    if filename.suffix == '.ursinamesh' and is_binary_ursinamesh(filename):
+        data = read_binary_ursinamesh(filename)
+    else:
+        data = assets.cached_mesh(filename, _read_model_file)
+    return data
+
+
+def mesh_from_data(data):
+    # makes the Mesh from what read_model_file() returned. the mesh gets generated from the numpy arrays, and model.vertices etc.
+    # only turn into the same lists the text .ursinamesh files have when they're used, unless numpy_arrays is True.
+    m = Mesh(**data)
+    if not numpy_arrays:
+        m._as_lists = frozenset(name for name in Mesh._data_names if isinstance(getattr(m, name), numpy.ndarray))
+    return m
+
+
+def _read_model_file(filename):
+    if filename.suffix == '.ursinamesh':
+        return read_ursinamesh(filename)
+
+    if filename.suffix == '.obj':
+        try:
+            positions, uvs, normals, parts = read_obj(filename)
+        except (ValueError, IndexError) as e:
+            print('error in obj file:', filename, e)
+            return None
+        triangles = numpy.concatenate(list(parts.values())) if parts else numpy.zeros((0, 3, 3), dtype=numpy.int32)
+        return _obj_mesh_data(positions, uvs, normals, triangles)
+
+    if filename.suffix == '.blend':
+        # export it to .obj with blender, then import that
+        compress_models(path=filename.parent, name=filename.stem)
+        obj_file = application.compressed_models_folder / (filename.stem + '.obj')
+        if not obj_file.exists():
+            return None
+        return _read_model_file(obj_file)
+
+
 # find blender installations
 if not hasattr(application, 'blender_paths') and application.development_mode:
     application.blender_paths = dict()
@@ -94,144 +153,440 @@ if not hasattr(application, 'blender_paths') and application.development_mode:
     pprint(application.blender_paths)
 
 
-def compress_models(path=None, outpath=application.compressed_models_folder, name='*'):
-
-    if not application.compressed_models_folder.exists():
-        application.compressed_models_folder.mkdir()
-
-    export_script_path = application.internal_scripts_folder / '_blend_export.py'
-    exported = list()
+def compress_models(path=None, outpath=application.compressed_models_folder, name='*', workers=1, force=False, on_progress=assets.print_progress):
+    # exports the .blend files in path to .obj files in outpath with blender, running workers blender processes at a time.
+    # .blend files older than their .obj file get skipped, unless force is True. returns the exported .blend files.
+    path = Path(path) if path else application.asset_folder
+    jobs = list()
     # print('ttttttttttttttttttttttttttttttttttttt', f'{path}**\\{name}.blend')
     for blend_file in path.glob(f'**/{name}.blend'):
+        out_file_path = outpath / (blend_file.stem + '.obj')
+        if not force and assets.is_up_to_date(blend_file, (out_file_path, )):
+            continue
+
         with open(blend_file, 'rb') as f:
             blender_version_number = (f.read(12).decode("utf-8"))[-3:]   # get version from start of .blend file e.g. 'BLENDER-v280'
             blender_version_number = blender_version_number[0] + '.' + blender_version_number[1:2]
             print('blender_version:', blender_version_number)
             if blender_version_number in application.blender_paths:
                 blender = application.blender_paths[blender_version_number]
-            else:
+            elif 'default' in application.blender_paths:
                 print('using default blender version')
                 blender = application.blender_paths['default']
+            else:
+                print('blender not found, can\'t convert:', blend_file)
+                continue
 
-        out_file_path = outpath / (blend_file.stem + '.obj')
-        print('converting .blend file to .obj:', blend_file, '-->', out_file_path, 'using:', blender)
-
-        if platform.system() == 'Windows':
-            subprocess.call(f'''{blender} {blend_file} --background --python {export_script_path} {out_file_path}''')
-        else:
-            subprocess.run((blender, blend_file, '--background', '--python', export_script_path, out_file_path))
+        jobs.append((blend_file, out_file_path, blender))
 
-        exported.append(blend_file)
+    if jobs:
+        outpath.mkdir(parents=True, exist_ok=True)
+    # each job waits on its own blender process, so threads are enough to run them in parallel
+    results = assets.run_jobs(_export_blend_file, jobs, workers, processes=False, on_progress=on_progress)
+    exported = [job[0] for job, result in zip(jobs, results) if result]
 
+    if exported:
+        asset_index.invalidate(outpath)
     return exported
 
 
+def _export_blend_file(blend_file, out_file_path, blender):
+    export_script_path = application.internal_scripts_folder / '_blend_export.py'
+    print('converting .blend file to .obj:', blend_file, '-->', out_file_path, 'using:', blender)
+
+    if platform.system() == 'Windows':
+        subprocess.call(f'''{blender} {blend_file} --background --python {export_script_path} {out_file_path}''', stdout=subprocess.DEVNULL)
+    else:
+        subprocess.run((blender, blend_file, '--background', '--python', export_script_path, out_file_path), stdout=subprocess.DEVNULL)
+
+    return out_file_path if out_file_path.exists() else None
+
+
+def vertex_buffer_stats(root=None):
+    '''
+    Debug info about how much vertex data the models under root (scene by default) share, for example after loading the same model many times.
+    Returns a dict with the number of geoms, the number of distinct vertex buffers they use,
+    and how many geoms use a buffer of their own (unique) or one that other geoms use too (shared).
+    '''
+    if root is None:
+        from ursina import scene
+        root = scene
+
+    users = dict()  # vertex data pointer : number of geoms using it
+    for node_path in root.findAllMatches('**/+GeomNode'):
+        geom_node = node_path.node()
+        for i in range(geom_node.getNumGeoms()):
+            key = geom_node.getGeom(i).getVertexData().this
+            users[key] = users.get(key, 0) + 1
+
+    return {
+        'geoms' : sum(users.values()),
+        'vertex_buffers' : len(users),
+        'unique' : sum(1 for n in users.values() if n == 1),
+        'shared' : sum(n for n in users.values() if n > 1),
+        }
+
+
+# binary .ursinamesh files start with the magic string, then the length of a json header describing the arrays,
+# then the header and the arrays themselves, aligned to 16 bytes so they can be used as they are, without copying.
+ursinamesh_magic = b'\x93URSINAMESH'
+ursinamesh_version = 1
+_ursinamesh_alignment = 16
+
+def _align(n):
+    return -(-n // _ursinamesh_alignment) * _ursinamesh_alignment
+
+
+def is_binary_ursinamesh(path):
+    with open(path, 'rb') as f:
+        return f.read(len(ursinamesh_magic)) == ursinamesh_magic
+
+
+def load_ursinamesh(path):
+    # loads both binary and text .ursinamesh files
+    if is_binary_ursinamesh(path):
+        return load_binary_ursinamesh(path)
+
+    with open(path) as f:
+        return eval(f.read())
+
+
+def _mesh_arguments(vertices=None, triangles=None, colors=None, uvs=None, normals=None, static=True, mode='triangle', thickness=1):
+    # takes the same arguments as Mesh(), but only returns them, so a mesh file can be read without making the Mesh
+    return dict(vertices=vertices, triangles=triangles, colors=colors, uvs=uvs, normals=normals, static=static, mode=mode, thickness=thickness)
+
+
+def read_ursinamesh(path):
+    # returns the arguments for Mesh() from a binary or text .ursinamesh file. doesn't touch panda3d, so it can run on another thread.
+    if is_binary_ursinamesh(path):
+        return read_binary_ursinamesh(path)
+
+    with open(path) as f:
+        return eval(f.read(), {**globals(), 'Mesh' : _mesh_arguments})
+
+
+def save_binary_ursinamesh(mesh, path):
+    write_binary_ursinamesh(dict(vertices=mesh.vertices, triangles=mesh._triangles, colors=mesh.colors, uvs=mesh.uvs, normals=mesh.normals,
+        static=mesh.static, mode=mesh.mode, thickness=mesh.thickness), path)
+
+
+def write_binary_ursinamesh(data, path):
+    # data is the arguments for Mesh(), like read_binary_ursinamesh() returns
+    arrays = dict()
+    arrays['vertices'] = Mesh._to_array(data['vertices'], 3)
+    for name, num_components in (('colors', 4), ('uvs', 2), ('normals', 3)):
+        values = data.get(name)
+        if values is not None and len(values):
+            arrays[name] = Mesh._to_array(values, num_components)
+
+    triangles = data.get('triangles')
+    if triangles is not None and len(triangles):
+        if not isinstance(triangles, numpy.ndarray):
+            if not hasattr(triangles[0], '__len__'):
+                triangles = numpy.array(triangles)
+            elif len(set(map(len, triangles))) == 1:
+                triangles = numpy.array(triangles).reshape(len(triangles), -1)
+            else:   # mixed triangles and quads, or lines of different lengths
+                arrays['triangle_sizes'] = numpy.array([len(t) for t in triangles], dtype=numpy.uint32)
+                triangles = numpy.array([i for t in triangles for i in t])
+        arrays['triangles'] = triangles.astype(numpy.uint32)
+
+    mode = data.get('mode', 'triangle')
+    header = {
+        'mode' : mode.value if hasattr(mode, 'value') else mode,
+        'static' : data.get('static', True),
+        'thickness' : data.get('thickness', 1),
+        'arrays' : dict(),
+        }
+    offset = 0  # from the start of the array data, which comes after the header
+    for name, array in arrays.items():
+        header['arrays'][name] = {'dtype' : array.dtype.newbyteorder('<').str, 'shape' : array.shape, 'offset' : offset}
+        offset += _align(array.nbytes)
+
+    header_bytes = json.dumps(header).encode()
+    data_start = _align(len(ursinamesh_magic) + 5 + len(header_bytes))
+    with open(path, 'wb') as f:
+        f.write(ursinamesh_magic)
+        f.write(numpy.array([ursinamesh_version], dtype='<u1').tobytes())
+        f.write(numpy.array([len(header_bytes)], dtype='<u4').tobytes())
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b'\0' * (data_start + header['arrays'][name]['offset'] - f.tell()))
+            f.write(array.astype(array.dtype.newbyteorder('<'), copy=False).tobytes())
+
+
+def load_binary_ursinamesh(path):
+    return Mesh(**read_binary_ursinamesh(path))
+
+
+def read_binary_ursinamesh(path):
+    # returns the arguments for Mesh(). the file gets read in one go and the arrays are views of that, instead of a memory mapped file,
+    # which would keep the file open as long as a mesh uses it, so it couldn't be overwritten or deleted on windows.
+    data = numpy.fromfile(path, dtype=numpy.uint8)
+    version_offset = len(ursinamesh_magic)
+    if data[version_offset] > ursinamesh_version:
+        raise ValueError(f'{path} is a version {data[version_offset]} .ursinamesh file, newer than this version of ursina supports')
+
+    header_length = int(data[version_offset+1 : version_offset+5].view('<u4')[0])
+    header = json.loads(bytes(data[version_offset+5 : version_offset+5+header_length]))
+    data_start = _align(version_offset + 5 + header_length)
+
+    arrays = dict()
+    for name, info in header['arrays'].items():
+        dtype = numpy.dtype(info['dtype'])
+        count = int(numpy.prod(info['shape']))
+        start = data_start + info['offset']
+        arrays[name] = data[start : start + count * dtype.itemsize].view(dtype).reshape(info['shape'])
+
+    triangles = arrays.get('triangles')
+    if 'triangle_sizes' in arrays:
+        triangles = [t.tolist() for t in numpy.split(triangles, numpy.cumsum(arrays['triangle_sizes'])[:-1])]
+
+    return dict(
+        vertices=arrays['vertices'],
+        triangles=triangles,
+        colors=arrays.get('colors'),
+        uvs=arrays.get('uvs'),
+        normals=arrays.get('normals'),
+        static=header['static'],
+        mode=header['mode'],
+        thickness=header['thickness'],
+        )
+
+
+def convert_ursinamesh_files(path=application.compressed_models_folder, name='*'):
+    # rewrites the text .ursinamesh files in path as binary ones, which load a lot faster
+    converted = list()
+    for filename in path.glob(f'**/{name}.ursinamesh'):
+        if is_binary_ursinamesh(filename):
+            continue
+
+        save_binary_ursinamesh(load_ursinamesh(filename), filename)
+        converted.append(filename)
+        print('converted to binary .ursinamesh:', filename)
+
+    return converted
+
+
+def read_obj(filepath, chunk_size=2**22):
+    '''
+    Parses an .obj file with numpy, reading chunk_size bytes at a time, so big files never have to be in memory as text or python objects.
+    Returns the positions, uvs and normals, and a dict with the faces of each (object, group, material) as an array of triangles,
+    shape (n, 3, 3), where each corner is the (position, uv, normal) index, or -1 if it doesn't have one. Larger faces get split into triangles.
+    '''
+    state = {
+        'counts' : [0, 0, 0],       # positions, uvs and normals so far, for negative indices
+        'values' : ([], [], []),
+        'part' : ('', '', ''),      # current object, group and material
+        'parts' : dict(),           # (object, group, material) : list of triangle arrays
+        }
+
+    with open(filepath, 'rb') as file:
+        rest = b''
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                if rest.strip():
+                    _read_obj_chunk(rest + b'\n', state)
+                break
+
+            chunk = rest + chunk
+            end = chunk.rfind(b'\n') + 1    # only parse whole lines, the rest goes with the next chunk
+            rest = chunk[end:]
+            if end:
+                _read_obj_chunk(chunk[:end], state)
+
+    positions, uvs, normals = [numpy.concatenate(values) if values else numpy.zeros((0, num_components)) for values, num_components in zip(state['values'], (3, 2, 3))]
+    parts = {key : numpy.concatenate(triangles) for key, triangles in state['parts'].items()}
+    return positions, uvs, normals, parts
+
+
+def _read_obj_chunk(text, state):
+    data = numpy.frombuffer(text, dtype=numpy.uint8)
+    line_ends = numpy.flatnonzero(data == ord('\n')) + 1
+    line_starts = numpy.concatenate(([0], line_ends[:-1]))
+    first, second = data[line_starts], data[numpy.minimum(line_starts + 1, len(data) - 1)]
+
+    line_types = numpy.zeros(len(line_starts), dtype=numpy.uint8)   # 0: ignored, 1: v, 2: vt, 3: vn, 4: f
+    line_types[(first == ord('v')) & (second <= ord(' '))] = 1
+    line_types[(first == ord('v')) & (second == ord('t'))] = 2
+    line_types[(first == ord('v')) & (second == ord('n'))] = 3
+    line_types[(first == ord('f')) & (second <= ord(' '))] = 4
+
+    # objects, groups and materials change rarely, so those lines are read one at a time
+    part_lines = [0]
+    parts = [state['part']]
+    for i in numpy.flatnonzero(numpy.isin(first, (ord('o'), ord('g'), ord('u')))).tolist():
+        words = text[line_starts[i]:line_ends[i]].split(maxsplit=1)
+        if words[0] not in (b'o', b'g', b'usemtl'):
+            continue
+        name = words[1].strip().decode(errors='replace') if len(words) > 1 else ''
+        part = list(parts[-1])
+        part[(b'o', b'g', b'usemtl').index(words[0])] = name
+        part_lines.append(i)
+        parts.append(tuple(part))
+    state['part'] = parts[-1]
+
+    # positions, uvs and normals. vertex colors after the position and the w after the uv get ignored.
+    for line_type, prefix, num_components in ((1, b'v', 3), (2, b'vt', 2), (3, b'vn', 3)):
+        is_type = line_types == line_type
+        if not is_type.any():
+            continue
+        lines = data[numpy.repeat(is_type, line_ends - line_starts)].tobytes().replace(prefix, b'')
+        values, lengths = _read_obj_numbers(lines, numpy.float64)
+        state['values'][line_type-1].append(_pad_rows(values, lengths, num_components, 0))
+
+    is_face = line_types == 4
+    if is_face.any():
+        lines = data[numpy.repeat(is_face, line_ends - line_starts)].tobytes().replace(b'f', b'').replace(b'//', b'/0/')
+        corner_counts, corner_slashes = _read_obj_corners(lines)
+        values, _ = _read_obj_numbers(lines.replace(b'/', b' '), numpy.int32)
+        corners = _pad_rows(values, corner_slashes + 1, 3, 0)
+
+        # obj indices start at 1 and negative ones count back from the last element so far. 0 means there is none.
+        face_lines = numpy.flatnonzero(is_face)
+        for i, count in enumerate(state['counts']):
+            counts_before = count + numpy.cumsum(line_types == i+1)[face_lines]
+            counts_before = numpy.repeat(counts_before.astype(numpy.int32), corner_counts)
+            column = corners[:,i]
+            corners[:,i] = numpy.where(column > 0, column - 1, numpy.where(column < 0, counts_before + column, -1))
+
+        # split the faces into triangle fans
+        triangle_counts = numpy.maximum(corner_counts - 2, 0)
+        face_of_triangle = numpy.repeat(numpy.arange(len(corner_counts)), triangle_counts)
+        nth = numpy.arange(len(face_of_triangle)) - numpy.repeat(numpy.cumsum(triangle_counts) - triangle_counts, triangle_counts)
+        first_corner = (numpy.cumsum(corner_counts) - corner_counts)[face_of_triangle]
+        triangles = corners[numpy.stack((first_corner, first_corner + nth + 1, first_corner + nth + 2), axis=1)]
+
+        part_of_triangle = (numpy.searchsorted(part_lines, face_lines, side='right') - 1)[face_of_triangle]
+        for part_index in numpy.unique(part_of_triangle).tolist():
+            state['parts'].setdefault(parts[part_index], list()).append(triangles[part_of_triangle == part_index])
+
+    for i in range(3):
+        state['counts'][i] += int(numpy.count_nonzero(line_types == i+1))
+
+
+def _read_obj_numbers(lines, dtype):
+    # returns all the numbers in lines, and how many there are on each line
+    values = numpy.fromstring(lines, dtype=dtype, sep=' ')
+    words = _word_starts(numpy.frombuffer(lines, dtype=numpy.uint8))
+    line_starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.frombuffer(lines, dtype=numpy.uint8) == ord('\n'))[:-1] + 1))
+    lengths = numpy.add.reduceat(words, line_starts, dtype=numpy.int64)
+    if lengths.sum() != len(values):
+        raise ValueError('could not parse obj numbers')
+    return values, lengths
+
+
+def _read_obj_corners(lines):
+    # returns how many corners each face has, and how many slashes each corner has
+    data = numpy.frombuffer(lines, dtype=numpy.uint8)
+    words = _word_starts(data)
+    line_starts = numpy.concatenate(([0], numpy.flatnonzero(data == ord('\n'))[:-1] + 1))
+    corner_counts = numpy.add.reduceat(words, line_starts, dtype=numpy.int64)
+    corner_slashes = numpy.add.reduceat((data == ord('/')).view(numpy.uint8), numpy.flatnonzero(words), dtype=numpy.int64)
+    return corner_counts, corner_slashes
+
+
+def _word_starts(data):
+    # 1 at the first character of each word, 0 elsewhere
+    is_space = data <= ord(' ')
+    starts = ~is_space
+    starts[1:] &= is_space[:-1]
+    return starts.view(numpy.uint8)
+
+
+def _pad_rows(values, lengths, num_components, fill):
+    # puts the numbers of each line in a row, cutting off or filling in to num_components
+    if len(lengths) and (lengths == num_components).all():
+        return values.reshape(-1, num_components)
+
+    rows = numpy.full((len(lengths), num_components), fill, dtype=values.dtype)
+    row_starts = numpy.cumsum(lengths) - lengths
+    for i in range(num_components):
+        has_value = lengths > i
+        rows[has_value, i] = values[row_starts[has_value] + i]
+    return rows
+
+
+def _obj_mesh_data(positions, uvs, normals, triangles):
+    # the arguments for an indexed Mesh, from the triangles read by read_obj(), with one vertex for each unique (position, uv, normal) combination
+    corners = triangles.reshape(-1, 3)
+    sizes = [len(positions), len(uvs) + 1, len(normals) + 1]
+    if sizes[0] * sizes[1] * sizes[2] < 2**62:    # one number per corner is a lot faster to sort
+        keys = corners[:,0].astype(numpy.int64) * (sizes[1] * sizes[2])
+        keys += (corners[:,1] + 1) * numpy.int64(sizes[2])
+        keys += corners[:,2] + 1
+    else:
+        keys = corners
+    _, first, inverse = numpy.unique(keys, axis=0 if keys.ndim == 2 else None, return_index=True, return_inverse=True)
+
+    # number the vertices in the order they first appear in, like the faces do
+    order = numpy.argsort(first)
+    new_index = numpy.empty(len(order), dtype=numpy.uint32)
+    new_index[order] = numpy.arange(len(order), dtype=numpy.uint32)
+    corners = corners[first[order]]
+
+    vertices = positions[corners[:,0]]
+    vertices[:,0] *= -1
+    data = dict(vertices=vertices, triangles=new_index[inverse.ravel()].reshape(-1, 3))
+    for name, values, column in (('uvs', uvs, 1), ('normals', normals, 2)):
+        if len(values):
+            data[name] = numpy.where(corners[:,column:column+1] >= 0, values[corners[:,column]], 0)
+
+    return data
+
+
 def obj_to_ursinamesh(
     path=application.compressed_models_folder,
     outpath=application.compressed_models_folder,
     name='*',
     return_mesh=True,
     save_to_file=False,
-    delete_obj=False
+    delete_obj=False,
+    split_by=None,      # 'object', 'group' or 'material' to return a dict with a mesh for each, instead of one mesh
     ):
 
     if name.endswith('.obj'):
         name = name[:-4]
 
     for f in path.glob(f'**/{name}.obj'):
-        filepath = path / (os.path.splitext(f)[0] + '.obj')
+        filepath = f
         print('read obj at:', filepath)
 
-
-        with open(filepath, 'r') as file:
-            lines = file.readlines()
-
-        verts = list()
-        tris = list()
-
-        uv_indices = list()
-        uvs = list()
-        norm_indices = list()
-        norms = list()
-
-        # parse the obj file to a Mesh
-        for i, l in enumerate(lines):
-            if l.startswith('v '):
-                vert = [float(v) for v in l[2:].strip().split(' ')]
-                vert[0] = -vert[0]
-                verts.append(tuple(vert))
-
-            elif l.startswith('vn '):
-                n = l[3:].strip().split(' ')
-                norms.append(tuple([float(e) for e in n]))
-
-            elif l.startswith('vt '):
-                uv = l[3:].strip()
-                uv = uv.split(' ')
-                uvs.append(tuple([float(e) for e in uv]))
-
-            elif l.startswith('f '):
-                l = l[2:]
-                l = l.split(' ')
-
-                try:
-                    tri = tuple([int(t.split('/')[0])-1 for t in l if t != '\n'])
-                except:
-                    print('error in obj file line:', i, ':', l)
-                    return
-                if len(tri) == 3:
-                    tris.extend(tri)
-                elif len(tri) == 4:
-                    tris.extend((tri[0], tri[1], tri[2], tri[2], tri[3], tri[0]))
-                else: # ngon
-                    for i in range(1, len(tri)-1):
-                        tris.extend((tri[i], tri[i+1], tri[0]))
-
-
-                try:
-                    uv = tuple([int(t.split('/')[1])-1 for t in l])
-                    if len(uv) == 3:
-                        uv_indices.extend(uv)
-                    elif len(uv) == 4:
-                        uv_indices.extend((uv[0], uv[1], uv[2], uv[2], uv[3], uv[0]))
-                    else: # ngon
-                        for i in range(1, len(uv)-1):
-                            uv_indices.extend((uv[i], uv[i+1], uv[0]))
-                except: # if no uvs
-                    pass
-
-                try:
-                    n = tuple([int(t.split('/')[2])-1 for t in l])
-                    if len(n) == 3:
-                        norm_indices.extend(n)
-                    elif len(uv) == 4:
-                        norm_indices.extend((n[0], n[1], n[2], n[2], n[3], n[0]))
-                    else: # ngon
-                        for i in range(1, len(n)-1):
-                            norm_indices.extend((n[i], n[i+1], n[0]))
-                except: # if no normals
-                    pass
-
+        try:
+            positions, uvs, normals, parts = read_obj(filepath)
+        except (ValueError, IndexError) as e:
+            print('error in obj file:', filepath, e)
+            return
+
+        if return_mesh and split_by:
+            key_index = ('object', 'group', 'material').index(split_by)
+            split = dict()
+            for key, triangles in parts.items():
+                split.setdefault(key[key_index], list()).append(triangles)
+            return {key : Mesh(**_obj_mesh_data(positions, uvs, normals, numpy.concatenate(triangles))) for key, triangles in split.items()}
+
+        triangles = numpy.concatenate(list(parts.values())) if parts else numpy.zeros((0, 3, 3), dtype=numpy.int32)
+        data = _obj_mesh_data(positions, uvs, normals, triangles)
         if return_mesh:
-            return Mesh(
-                vertices=[verts[t] for t in tris],
-                normals=[norms[nid] for nid in norm_indices],
-                uvs=[uvs[uid] for uid in uv_indices]
-            )
+            return Mesh(**data)
 
         meshstring = ''
         meshstring += 'Mesh('
 
         meshstring += '\nvertices='
-        meshstring += str(tuple([verts[t] for t in tris]))
+        meshstring += str(tuple(map(tuple, data['vertices'].tolist())))
+
+        meshstring += ', \ntriangles='
+        meshstring += str(tuple(data['triangles'].ravel().tolist()))
 
-        if uv_indices:
+        if 'uvs' in data:
             meshstring += ', \nuvs='
-            meshstring += str(tuple([uvs[uid] for uid in uv_indices]))
+            meshstring += str(tuple(map(tuple, data['uvs'].tolist())))
 
-        if norm_indices:
+        if 'normals' in data:
             meshstring += ', \nnormals='
-            meshstring += str(tuple([norms[nid] for nid in norm_indices]))
+            meshstring += str(tuple(map(tuple, data['normals'].tolist())))
 
         meshstring += ''', \nmode='triangle')'''
 
@@ -245,6 +600,7 @@ def obj_to_ursinamesh(
         if delete_obj:
             os.remove(filepath)
 
+        asset_index.invalidate(outfilepath.parent)
         print('saved ursinamesh to:', outfilepath)
 
 # faster, but does not apply modifiers
@@ -311,21 +667,24 @@ def ursina_mesh_to_obj(mesh, name='', out_path=application.compressed_models_fol
     obj = 'o ' + name + '\n'
 
 
-    for v in mesh.vertices:
+    for v in Mesh._to_list(mesh.vertices):
         v = [round(e, max_decimals) for e in v]
         obj += f'v {v[0]} {v[1]} {v[2]}\n'
 
-    if mesh.uvs:
-        for uv in mesh.uvs:
+    if len(mesh.uvs):
+        for uv in Mesh._to_list(mesh.uvs):
             uv = [round(e, max_decimals) for e in uv]
             obj += f'vt {uv[0]} {uv[1]}\n'
 
     obj += 's off\n'
 
-    if mesh.triangles:
+    tris = range(len(mesh.vertices))    # without triangles, every three vertices are a triangle
+    if len(mesh.triangles):
         tris = mesh.triangles
+        if isinstance(tris, numpy.ndarray):
+            tris = tris.tolist()
 
-        if isinstance(tris[0], tuple): # convert from tuples to flat
+        if hasattr(tris[0], '__len__'): # convert from tuples to flat
             new_tris = list()
             for t in tris:
                 if len(t) == 3:
@@ -347,7 +706,7 @@ def ursina_mesh_to_obj(mesh, name='', out_path=application.compressed_models_fol
         if i % 3 == 0:
             obj += '\nf '
         obj += str(t+1)
-        if mesh.uvs:
+        if len(mesh.uvs):
             obj += '/'+str(t+1)
         obj += ' '
 
@@ -366,6 +725,7 @@ def compress_internal():
         application.internal_models_compressed_folder,
         save_to_file=True, delete_obj=True
         )
+    convert_ursinamesh_files(application.internal_models_compressed_folder)
 
 
 if __name__ == '__main__':
@@ -95,46 +95,13 @@ if __name__ == '__main__':
 
 
     # e.collider = 'mesh'
-    # terrains = list()
-    # for i in (1,2,4,8):
-    #     e = Entity(model=Terrain('heightmap_1', skip=i), scale=(20,5,20))
-    #     e.texture='heightmap_1'
-    #     e.enabled = False
-    #     terrains.append(e)
-    #
+    # current_terrain = Entity(model=Terrain('heightmap_1'), scale=(20,5,20), texture='heightmap_1', lod_distances=(20, 40, 80))
     # EditorCamera()
-    # # 20, 40, 80, 160
-    # current_terrain = terrains[0]
-    # current_terrain.enabled = True
-    #
-    # lod_level = 0
-    # def set_lod_level(n):
-    #     global lod_level, terrain
-    #
-    #     for e in terrains:
-    #         e.enabled = False
-    #     terrains[n].enabled = True
-    #     current_terrain = terrains[n]
-    #
-    #     lod_level = n
     #
     # water = Entity(model='plane', collider='mesh', position=current_terrain.position, scale=current_terrain.scale)
     # cursor = Entity(model='sphere', color=color.red)
     #
     # def update():
-    #     global lod_level
-    #     dist = distance(camera.world_position, terrains[0].world_position)
-    #     # print(dist, lod_level)
-    #     if lod_level != 0 and dist < 20:
-    #         set_lod_level(0)
-    #     if lod_level != 1 and dist > 20 and dist < 40:
-    #         set_lod_level(1)
-    #     if lod_level != 2 and dist > 40 and dist < 80:
-    #         set_lod_level(2)
-    #     if lod_level != 3 and dist > 80 and dist < 160:
-    #         set_lod_level(3)
-    #
-    #
     #     if water.hovered:
     #         cursor.position = mouse.world_point
     #         grid_x = mouse.point[0] + .5
@@ -1,4 +1,5 @@
 from ursina import *
+from ursina import asset_index
 
 model_folders = ( # folder search order
     application.asset_folder,
@@ -14,12 +15,14 @@ texture_folders = ( # folder search order
 
 class Animation(Entity):
 
+    _setattr_hooks = {'origin' : '_set_origin', 'loop' : '_set_loop'}
+
     def __init__(self, name, fps=12, loop=True, autoplay=True, frame_times=None, **kwargs):
         super().__init__()
 
         models = list()
         for folder in model_folders:
-            models = list(folder.glob(f'**/{name}*.obj'))
+            models = asset_index.find(folder, f'{name}*.obj')
             if models:
                 break
 
@@ -30,7 +33,7 @@ class Animation(Entity):
                 break
 
             for file_type in ('png', 'jpg'):
-                textures = list(folder.glob(f'**/{name}*.{file_type}'))
+                textures = asset_index.find(folder, f'{name}*.{file_type}')
                 if textures:
                     found_textures = True
                     break
@@ -100,18 +103,25 @@ class Animation(Entity):
         return self.sequence.duration
 
 
-    def __setattr__(self, name, value):
-        if hasattr(self, 'frames') and name in ('color', 'origin'):
+    def _set_color(self, name, value):
+        if hasattr(self, 'frames'):
+            for f in self.frames:
+                f.color = value
+
+        super()._set_color(name, value)
+
+
+    def _set_origin(self, name, value):
+        if hasattr(self, 'frames'):
             for f in self.frames:
-                setattr(f, name, value)
+                f.origin = value
+
+        self._set(name, value)
 
-        if name == 'loop':
-            self.sequence.loop = value
 
-        try:
-            super().__setattr__(name, value)
-        except Exception as e:
-            return e
+    def _set_loop(self, name, value):
+        self.sequence.loop = value
+        self._set(name, value)
 
 
 
@@ -7,6 +7,7 @@ class Button(Entity):
 
     color = color.black66
     default_model = None # will deatult to rounded Quad
+    _setattr_hooks = {'origin' : '_set_origin', 'on_click' : '_set_on_click'}
 
     def __init__(self, text='', **kwargs):
         super().__init__()
@@ -108,44 +109,44 @@ class Button(Entity):
                 self._icon.texture = value
 
 
-    def __setattr__(self, name, value):
-        if name == 'color':
-            try:
-                self.highlight_color = value.tint(.2)
-                self.pressed_color = value.tint(-.2)
-            except:
-                pass
+    def _set_color(self, name, value):
+        try:
+            self.highlight_color = value.tint(.2)
+            self.pressed_color = value.tint(-.2)
+        except:
+            pass
 
-        if name == 'origin':
-            if hasattr(self, 'text_entity') and self.text_entity:
-                self.text_entity.world_parent = self.model
-                super().__setattr__(name, value)
-                self.text_entity.world_parent = self
-            else:
-                super().__setattr__(name, value)
+        super()._set_color(name, value)
 
-            try:    # update collider position by making a new one
-                self.collider = 'box'
-            except Exception as e:
-                return e
 
+    def _set_origin(self, name, value):
+        if hasattr(self, 'text_entity') and self.text_entity:
+            self.text_entity.world_parent = self.model
+            self._set(name, value)
+            self.text_entity.world_parent = self
+        else:
+            self._set(name, value)
 
-        if name == 'on_click':
-            self._on_click = value
+        try:    # update collider position by making a new one
+            self.collider = 'box'
+        except:
+            pass
 
-            if isinstance(value, Sequence):
-                value.auto_destroy = False
-            return
 
-        if name == 'eternal':
-            try:
-                self.text_entity.eternal = value
-            except:
-                pass
+    def _set_on_click(self, name, value):
+        self._on_click = value
+
+        if isinstance(value, Sequence):
+            value.auto_destroy = False
+
+
+    def _set_eternal(self, name, value):
         try:
-            super().__setattr__(name, value)
-        except Exception as e:
-            return e
+            self.text_entity.eternal = value
+        except:
+            pass
+
+        super()._set_eternal(name, value)
 
 
     def input(self, key):
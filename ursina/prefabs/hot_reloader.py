@@ -143,21 +143,29 @@ class HotReloader(Entity):
 
 
     def reload_textures(self):
-        textured_entities = [e for e in scene.entities if e.texture]
-        reloaded_textures = list()
+        textured_entities = [e for e in scene.entities if e.texture and getattr(e.texture, 'path', None)]
+        reloaded_textures = dict()  # path : panda3d texture
 
         for e in textured_entities:
-            if e.texture.name in reloaded_textures:
-                continue
-
-            if e.texture.path.parent.name == application.compressed_textures_folder.name:
-                print('texture is made from .psd file', e.texture.path.stem + '.psd')
-                compress_textures(e.texture.path.stem)
-            print('reloaded texture:', e.texture.path)
-            e.texture._texture.reload()
-            reloaded_textures.append(e.texture.name)
-
-        return reloaded_textures
+            path = e.texture.path
+            if path not in reloaded_textures:
+                if path.parent.name == application.compressed_textures_folder.name:
+                    print('texture is made from .psd file', path.stem + '.psd')
+                    compress_textures(path.stem)
+                e.texture.reload()  # the panda3d texture would reload from the import cache, so get a new one
+                reloaded_textures[path] = e.texture._texture
+                print('reloaded texture:', path)
+
+            # copies of the texture share the panda3d texture, so give them the new one too
+            e.texture._texture = reloaded_textures[path]
+            e.texture.filtering = e.texture.filtering
+            e.texture = e.texture
+
+        for t in texture_importer.imported_textures.values():
+            if getattr(t, 'path', None) in reloaded_textures:
+                t._texture = reloaded_textures[t.path]
+
+        return [path.name for path in reloaded_textures]
 
 
     def reload_models(self):
@@ -113,18 +113,15 @@ class Slider(Entity):
 
 
 
-    def __setattr__(self, name, value):
-        if name == 'eternal':
-            try:
-                self.label.eternal = value
-                self.bg.eternal = value
-                self.knob.eternal = value
-            except:
-                pass
+    def _set_eternal(self, name, value):
         try:
-            super().__setattr__(name, value)
-        except Exception as e:
-            return e
+            self.label.eternal = value
+            self.bg.eternal = value
+            self.knob.eternal = value
+        except:
+            pass
+
+        super()._set_eternal(name, value)
 
 
 
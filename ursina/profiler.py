@@ -0,0 +1,151 @@
+import csv
+import json
+from time import perf_counter
+from collections import defaultdict, deque
+from pathlib import Path
+
+
+enabled = False         # toggle with F3 in development mode, or with set_enabled()
+history_length = 300    # how many frames to calculate the averages and p99 over
+
+_history = dict()               # (category, name) : deque with the time spent per frame, in seconds
+_frame = defaultdict(float)     # (category, name) : time spent so far this frame
+_last_frame_end = None
+
+
+class _Phase():
+    def __init__(self, name):
+        self.key = ('phase', name)
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *args):
+        _frame[self.key] += perf_counter() - self.start
+
+
+class _NoPhase():
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+_no_phase = _NoPhase()
+
+
+def phase(name):
+    # usage: with profiler.phase('sequences'): ...
+    if not enabled:
+        return _no_phase
+    return _Phase(name)
+
+
+def call(category, name, func, *args):
+    start = perf_counter()
+    func(*args)
+    _frame[(category, name)] += perf_counter() - start
+
+
+def set_enabled(value):
+    # also forgets when the last frame ended, so the first frame after enabling it again doesn't include the time it was disabled
+    global enabled, _last_frame_end
+    enabled = value
+    if not value:
+        _last_frame_end = None
+
+
+def end_frame():    # called by main at the end of every frame while enabled
+    global _last_frame_end
+    now = perf_counter()
+    if _last_frame_end is not None:
+        _frame[('phase', 'frame')] += now - _last_frame_end
+    _last_frame_end = now
+
+    for key, value in _frame.items():
+        if not key in _history:
+            _history[key] = deque(maxlen=history_length)
+        _history[key].append(value)
+
+    _frame.clear()
+
+
+def clear():
+    global _last_frame_end
+    _history.clear()
+    _frame.clear()
+    _last_frame_end = None
+
+
+def stats(category=None):
+    # returns a list of dicts, slowest first. times are in milliseconds per frame.
+    results = list()
+    for (cat, name), times in _history.items():
+        if category and cat != category:
+            continue
+
+        sorted_times = sorted(times)
+        results.append({
+            'category' : cat,
+            'name' : name,
+            'frames' : len(times),
+            'average' : sum(times) / len(times) * 1000,
+            'p99' : sorted_times[min(int(len(times) * .99), len(times)-1)] * 1000,
+            'max' : sorted_times[-1] * 1000,
+            'last' : times[-1] * 1000,
+            })
+
+    results.sort(key=lambda e: e['average'], reverse=True)
+    return results
+
+
+def save(path='profile.csv'):
+    # saves stats() as .csv or .json, depending on the file extension
+    path = Path(path)
+    results = stats()
+
+    if path.suffix == '.json':
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    else:
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=('category', 'name', 'frames', 'average', 'p99', 'max', 'last'))
+            writer.writeheader()
+            writer.writerows(results)
+
+    print('saved profiler stats to:', path)
+    return path
+
+
+def to_text(max_lines=12):
+    text = f'{"ms/frame":<34} avg    p99\n'
+    for e in stats()[:max_lines]:
+        text += f'{e["category"][0]} {e["name"][:30]:<32} {e["average"]:.2f}  {e["p99"]:.2f}\n'
+    return text
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+    '''
+    Measures the time spent in update()/fixed_update()/input() per entity class and per script class,
+    as well as the engine phases (mouse, sequences, entities and so on).
+    Press F3 to show the profiler panel, or call profiler.set_enabled(True).
+    '''
+    class SlowEntity(Entity):
+        def update(self):
+            sum(range(10000))
+
+    for i in range(10):
+        SlowEntity()
+
+    profiler.set_enabled(True)
+
+    def input(key):
+        if key == 's':
+            profiler.save('profile.csv')
+            profiler.save('profile.json')
+
+    app.run()
@@ -1,4 +1,5 @@
 import sys
+from itertools import count
 from panda3d.core import NodePath
 from panda3d.core import Fog
 from ursina import color
@@ -23,6 +24,14 @@ class Scene(NodePath):
 
         self.lights = []
 
+        # entities that have update()/fixed_update()/input() on themselves or one of their scripts.
+        # kept up to date by Entity.__setattr__, Entity.add_script() and destroy(), so the main loop doesn't have to scan every entity.
+        self._update_entities = dict()  # entity : creation index
+        self._fixed_update_entities = dict()
+        self._input_entities = dict()
+        self._entity_counter = count()
+        self._callbacks_sorted = True
+
     def set_up(self):
         from ursina.entity import Entity
         self.reparent_to(render)
@@ -53,6 +62,45 @@ class Scene(NodePath):
         application.sequences.clear()
 
 
+    def _register_callbacks(self, entity):
+        # called when enabled, ignore, update, fixed_update, input or scripts change on an entity
+        if not hasattr(entity, '_creation_index') or entity.is_empty():
+            return
+
+        active = entity.enabled and not entity.ignore
+        scripts = entity.scripts if hasattr(entity, 'scripts') else ()
+
+        for registry, name in self._callback_registries:
+            if active and (hasattr(entity, name) or any(hasattr(s, name) for s in scripts)):
+                if entity not in registry:
+                    if registry and entity._creation_index < next(reversed(registry.values())):
+                        self._callbacks_sorted = False
+                    registry[entity] = entity._creation_index
+            else:
+                registry.pop(entity, None)
+
+
+    @property
+    def _callback_registries(self):
+        return (
+            (self._update_entities, 'update'),
+            (self._fixed_update_entities, 'fixed_update'),
+            (self._input_entities, 'input'),
+            )
+
+    def _unregister_callbacks(self, entity):
+        for registry, name in self._callback_registries:
+            registry.pop(entity, None)
+
+
+    def _sort_callbacks(self):
+        # re-enabled entities get added to the end, so restore creation order to keep the same update order as scene.entities.
+        self._update_entities = dict(sorted(self._update_entities.items(), key=lambda e: e[1]))
+        self._fixed_update_entities = dict(sorted(self._fixed_update_entities.items(), key=lambda e: e[1]))
+        self._input_entities = dict(sorted(self._input_entities.items(), key=lambda e: e[1]))
+        self._callbacks_sorted = True
+
+
     @property
     def fog_color(self):
         return self.fog.getColor()
@@ -4,68 +4,37 @@ from ursina import *
 
 
 def combine(entity, analyze=False, auto_destroy=True):
-    verts = list()
-    tris = list()
-    norms = list()
-    uvs = list()
-    cols = list()
+    meshes = list()
+    transforms = list()
+    colors = list()
     to_destroy = list()
-    o = 0
-
 
     for e in scene.entities:
         if e.has_ancestor(entity) or e == entity:
             if not hasattr(e, 'model') or e.model == None or e.scripts or e.eternal:
                 continue
-            if not e.model.vertices:
+            if not len(e.model.vertices) or e.model.mode != 'triangle':
                 continue
 
             if analyze:
                 print('combining:', e)
 
-            verts += get_vertices(e, entity)
-
-            if not e.model.triangles:
-                new_tris = [i for i in range(len(e.model.vertices))]
-
-            else:
-                new_tris = list()
-                for t in e.model.triangles:
-                    if isinstance(t, int):
-                        new_tris.append(t)
-                    elif len(t) == 3:
-                        new_tris.extend(t)
-                    elif len(t) == 4: # turn quad into tris
-                        new_tris.extend([t[0], t[1], t[2], t[2], t[3], t[0]])
-
-            new_tris = [t+o for t in new_tris]
-            new_tris = [(new_tris[i], new_tris[i+1], new_tris[i+2]) for i in range(0, len(new_tris), 3)]
-
-            o += len(e.model.vertices)
-            tris += new_tris
-
-            # if e.model.normals:
-            #     norms += e.model.normals
-
-            if e.model.uvs:
-                uvs += e.model.uvs
-
-            if e.model.colors: # if has vertex colors
-                cols.extend(e.model.colors)
-            else:
-                cols.extend((e.color, ) * len(e.model.vertices))
-
+            meshes.append(e.model)
+            transforms.append(e.getMat(entity))     # the vertices relative to entity, like get_vertices()
+            colors.append(e.color)     # for models without vertex colors
 
             if auto_destroy and e != entity:
                 to_destroy.append(e)
 
+    # all the vertices get transformed and put together at once, instead of one at a time
+    model = Mesh.concatenate(meshes, transforms, colors)
+
     if auto_destroy:
         from ursina import destroy
         [destroy(e) for e in to_destroy]
 
-    entity.model = Mesh(vertices=verts, triangles=tris, normals=norms, uvs=uvs, colors=cols, mode='triangle')
+    entity.model = model
     print('combined')
-    # entity.model = Mesh(vertices=verts,  mode='triangle')
     # entity.flatten_strong()
     if analyze:
         render.analyze()
@@ -17,13 +17,17 @@ def normalize_v3(arr):
 def generate_normals(vertices, triangles=None, smooth=True):
     import numpy
 
-    if not triangles:
+    if triangles is None or not len(triangles):
         # print('generated triangles:', triangles)
         new_tris = [(i, i+1, i+2) for i in range(0, len(vertices), 3)]
+    elif isinstance(triangles, numpy.ndarray):
+        if triangles.ndim == 2 and triangles.shape[1] == 4: # turn quads into tris
+            triangles = triangles[:, (0,1,2,2,3,0)]
+        new_tris = triangles.reshape(-1, 3)
     else:
         new_tris = list()
         for t in triangles:
-            if isinstance(t, int):
+            if not hasattr(t, '__len__'):
                 new_tris.append(t)
             elif len(t) == 3:
                 new_tris.extend(t)
@@ -0,0 +1,160 @@
+import heapq
+import numpy
+
+
+def _face_quadrics(vertices, triangles):
+    # the plane of each triangle as a quadric, weighted by area. stored as the 10 unique values of the symmetric 4x4 matrix.
+    a, b, c = vertices[triangles[:,0]], vertices[triangles[:,1]], vertices[triangles[:,2]]
+    normals = numpy.cross(b - a, c - a)
+    areas = numpy.linalg.norm(normals, axis=1)
+    normals /= numpy.maximum(areas, 1e-12)[:,None]
+    planes = numpy.hstack([normals, -numpy.einsum('ij,ij->i', normals, a)[:,None]])
+    return _plane_quadrics(planes) * (areas[:,None] / 2)
+
+
+def _plane_quadrics(planes):
+    x, y, z, w = planes.T
+    return numpy.stack([x*x, x*y, x*z, x*w, y*y, y*z, y*w, z*z, z*w, w*w], axis=1)
+
+
+def _error(q, v):
+    x, y, z = v
+    return (q[0]*x*x + 2*q[1]*x*y + 2*q[2]*x*z + 2*q[3]*x + q[4]*y*y + 2*q[5]*y*z + 2*q[6]*y + q[7]*z*z + 2*q[8]*z + q[9])
+
+
+def simplify_mesh(vertices, triangles, ratio, boundary_weight=1000):
+    return simplify_mesh_lods(vertices, triangles, (ratio, ), boundary_weight)[0]
+
+
+def simplify_mesh_lods(vertices, triangles, ratios, boundary_weight=1000):
+    '''
+    Reduces the number of triangles to about each of the ratios of the original, in a single pass,
+    by collapsing the edges that change the shape the least, measured with quadric error metrics (Garland and Heckbert). Edges get collapsed into one of their vertices, instead of a new point,
+    so the remaining vertices keep their uvs, normals and colors. Weld the mesh first, since only shared vertices can be collapsed.
+    Open edges, including uv seams, are kept in place with boundary_weight.
+    Returns a list with, for each ratio, the indices of the vertices that are still used and the new triangles, which index into those.
+    '''
+    vertices = numpy.asarray(vertices, dtype=numpy.float64).reshape(-1, 3)
+    triangles = numpy.asarray(triangles, dtype=numpy.int64).reshape(-1, 3)
+    triangles = triangles[(triangles[:,0] != triangles[:,1]) & (triangles[:,1] != triangles[:,2]) & (triangles[:,2] != triangles[:,0])]
+    results = dict()    # ratio : (kept vertices, triangles)
+
+    quadrics = numpy.zeros((len(vertices), 10))
+    face_quadrics = _face_quadrics(vertices, triangles)
+    for i in range(3):
+        numpy.add.at(quadrics, triangles[:,i], face_quadrics)
+
+    # keep open edges in place with a plane along the edge, perpendicular to the face
+    edges = numpy.concatenate([triangles[:,(0,1)], triangles[:,(1,2)], triangles[:,(2,0)]])
+    _, inverse, counts = numpy.unique(numpy.sort(edges, axis=1), axis=0, return_inverse=True, return_counts=True)
+    boundary = counts[inverse.ravel()] == 1
+    if boundary.any():
+        a, b = vertices[edges[boundary,0]], vertices[edges[boundary,1]]
+        face_normals = numpy.cross(vertices[triangles[:,1]] - vertices[triangles[:,0]], vertices[triangles[:,2]] - vertices[triangles[:,0]])
+        face_normals = numpy.tile(face_normals, (3, 1))[boundary]
+        normals = numpy.cross(b - a, face_normals)
+        lengths = numpy.linalg.norm(normals, axis=1)
+        normals /= numpy.maximum(lengths, 1e-12)[:,None]
+        planes = numpy.hstack([normals, -numpy.einsum('ij,ij->i', normals, a)[:,None]])
+        weights = numpy.sum((b - a) ** 2, axis=1) * boundary_weight
+        for i in range(2):
+            numpy.add.at(quadrics, edges[boundary,i], _plane_quadrics(planes) * weights[:,None])
+
+    positions = vertices.tolist()
+    quadrics = quadrics.tolist()
+    faces = triangles.tolist()
+    vertex_faces = [set() for v in positions]
+    for i, f in enumerate(faces):
+        for v in f:
+            vertex_faces[v].add(i)
+
+    versions = [0] * len(positions)
+
+    def collapse(u, v):
+        # (error, vertex to remove, vertex to keep, versions). collapses into whichever end of the edge adds the least error.
+        q = [a + b for a, b in zip(quadrics[u], quadrics[v])]
+        error_u, error_v = _error(q, positions[u]), _error(q, positions[v])
+        if error_u < error_v:
+            u, v = v, u
+        return (min(error_u, error_v), u, v, versions[u], versions[v])
+
+    heap = [collapse(u, v) for u, v in numpy.unique(numpy.sort(edges, axis=1), axis=0).tolist()]
+    heapq.heapify(heap)
+
+    def flips(u, v):
+        # True if moving u onto v would turn any of u's other triangles over
+        pv = positions[v]
+        for i in vertex_faces[u]:
+            f = faces[i]
+            if v in f:
+                continue
+            a, b, c = [positions[e] for e in f]
+            n_before = _cross(_sub(b, a), _sub(c, a))
+            a, b, c = [pv if e == u else positions[e] for e in f]
+            n_after = _cross(_sub(b, a), _sub(c, a))
+            if sum(x*y for x, y in zip(n_before, n_after)) <= 0:
+                return True
+        return False
+
+    face_count = len(faces)
+    for ratio in sorted(set(ratios), reverse=True):
+        while face_count > len(triangles) * ratio and heap:
+            error, u, v, version_u, version_v = heapq.heappop(heap)
+            if versions[u] != version_u or versions[v] != version_v:
+                continue    # outdated, one of the vertices changed since this was added
+            if flips(u, v):
+                continue
+
+            # move u onto v and remove the triangles that had both
+            for i in list(vertex_faces[u]):
+                f = faces[i]
+                if v in f:
+                    for e in f:
+                        if e != u:
+                            vertex_faces[e].discard(i)
+                    faces[i] = None
+                    face_count -= 1
+                else:
+                    f[f.index(u)] = v
+                    vertex_faces[v].add(i)
+            vertex_faces[u] = set()
+            quadrics[v] = [a + b for a, b in zip(quadrics[u], quadrics[v])]
+            versions[u] += 1
+            versions[v] += 1
+
+            neighbors = {e for i in vertex_faces[v] for e in faces[i] if e != v}
+            for w in neighbors:
+                heapq.heappush(heap, collapse(w, v))
+
+        results[ratio] = _compact(faces, len(vertices))
+
+    return [results[ratio] for ratio in ratios]
+
+
+def _compact(faces, vertex_count):
+    faces = numpy.array([f for f in faces if f is not None], dtype=numpy.int64).reshape(-1, 3)
+    kept = numpy.unique(faces)
+    remap = numpy.zeros(vertex_count, dtype=numpy.uint32)
+    remap[kept] = numpy.arange(len(kept), dtype=numpy.uint32)
+    return kept, remap[faces]
+
+
+def _sub(a, b):
+    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
+
+def _cross(a, b):
+    return (a[1]*b[2] - a[2]*b[1], a[2]*b[0] - a[0]*b[2], a[0]*b[1] - a[1]*b[0])
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+
+    sphere = load_model('sphere', application.internal_models_compressed_folder).weld()
+    for i, ratio in enumerate((1, .5, .25, .1)):
+        kept, triangles = simplify_mesh(sphere.vertices, sphere.triangles, ratio)
+        Entity(model=Mesh(vertices=numpy.array(sphere.vertices)[kept], triangles=triangles, mode='line'), x=i*1.5)
+
+    EditorCamera()
+    app.run()
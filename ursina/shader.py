@@ -1,6 +1,7 @@
 from pathlib import Path
 from panda3d.core import Shader as Panda3dShader
 from ursina import application
+from ursina import asset_index
 
 default_vertex_shader = '''
 #version 430
@@ -55,7 +56,7 @@ class Shader:
 
         for sh, name in parts.items():
             for folder in folders:
-                for filename in folder.glob('**/' + name):
+                for filename in asset_index.find(folder, name):
                     with filename.open("rt") as f:
                         parts[sh] = f.read()
 
@@ -2,6 +2,7 @@ from ursina.shaders.normals import normals_shader
 from ursina.shaders.basic_lighting import basic_lighting_shader
 from ursina.shaders.triplanar import triplanar_shader
 from ursina.shaders.colored_lights import colored_lights_shader
+from ursina.shaders.instancing import instancing_shader
 
 
 
@@ -0,0 +1,46 @@
+from ursina import *
+
+
+instancing_shader = Shader(language=Shader.GLSL,
+vertex='''
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;    // 4 texels per instance: the 3 rows of the transform matrix, then the color
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+in vec4 p3d_Color;
+out vec2 texcoord;
+out vec4 vertex_color;
+
+void main() {
+    int i = gl_InstanceID * 4;
+    mat4 transform = mat4(texelFetch(instance_data, i), texelFetch(instance_data, i+1), texelFetch(instance_data, i+2), vec4(0, 0, 0, 1));
+    gl_Position = p3d_ModelViewProjectionMatrix * (p3d_Vertex * transform);
+    texcoord = p3d_MultiTexCoord0;
+    vertex_color = p3d_Color * texelFetch(instance_data, i+3);
+}
+''',
+
+fragment='''
+#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+in vec2 texcoord;
+in vec4 vertex_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = texture(p3d_Texture0, texcoord) * p3d_ColorScale * vertex_color;
+}
+''',
+)
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+    # the shader gets set up by InstancedEntityGroup, since it needs the instance data buffer
+    InstancedEntityGroup(model='cube', texture='white_cube', positions=[(x*2, 0, z*2) for z in range(16) for x in range(16)])
+    EditorCamera()
+    app.run()
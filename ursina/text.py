@@ -213,7 +213,7 @@ class Text(Entity):
 
     @font.setter
     def font(self, value):
-        font = loader.loadFont(value)
+        font = loader.loadFont(value, okMissing=True)
         if font:
             self._font = font
             self._font.clear()  # remove assertion warning
@@ -274,6 +274,7 @@ class Text(Entity):
 
     @resolution.setter
     def resolution(self, value):
+        self._font.clear()  # remove assertion warning
         self._font.setPixelsPerUnit(value)
 
     @property
@@ -331,7 +332,7 @@ class Text(Entity):
 
     def align(self):
         value = self.origin
-        linewidths = [self.text_nodes[0].node().calcWidth(line) for line in self.lines]
+        linewidths = [self.text_nodes[0].node().calcWidth(line) for line in self.text.split('\n')]   # not splitlines(), so a trailing newline is a line too
         # print('.........', linewidths)
         for tn in self.text_nodes:
             # center text horizontally
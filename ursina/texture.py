@@ -20,11 +20,14 @@ class Texture():
 
         if isinstance(value, Path):
             self.path = Path(value)
-            self._texture = loader.loadTexture(Filename.fromOsSpecific(str(value)))
+            from ursina import assets
+            self._texture = assets.cached_texture(value)   # decoded and mipmapped already, if it was loaded before
             self._cached_image = None   # for get_pixel() method
 
         elif isinstance(value, PandaTexture):
             self._texture = value
+            self._cached_image = None
+            self.path = None
 
         else:
             from PIL import Image
@@ -154,6 +157,15 @@ class Texture():
 
         self._cached_image.save(path)
 
+    def reload(self):
+        # loads the file again, through the import cache, which sees that it changed. replaces the panda3d texture, so entities using it have to set it again.
+        from ursina import assets
+        from panda3d.core import TexturePool
+        TexturePool.releaseTexture(self._texture)   # or loading the same file again would give the old one back
+        self._texture = assets.cached_texture(self.path)
+        self._cached_image = None
+        self.filtering = self.filtering
+
 if __name__ == '__main__':
     from ursina import *
     app = Ursina()
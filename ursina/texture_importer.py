@@ -1,6 +1,8 @@
 from pathlib import Path
 from copy import copy
 from ursina import application
+from ursina import asset_index
+from ursina import assets
 from ursina.texture import Texture
 
 
@@ -25,41 +27,22 @@ def load_texture(name, path=None):
     if name in imported_textures:
         return copy(imported_textures[name])
 
-    folders = ( # folder search order
-        application.compressed_textures_folder,
-        application.asset_folder,
-        application.internal_textures_folder,
-        )
-    if path:
-        if isinstance(path, str):
-            folders = (Path(path),)
-        else:
-            folders = (path,)
-
+    folders = _texture_folders(path)
     if name.endswith('.mp4'):
         for folder in folders:
-            for filename in folder.glob('**/' + name):
+            for filename in asset_index.find(folder, name):
                 # print('loaded movie texture:', filename)
                 return loader.loadTexture(filename.resolve())
 
-
-    for folder in folders:
-        if '.' in name: # got name with file extention
-            for filename in folder.glob('**/' + name):
-                t =  Texture(filename.resolve())
-                imported_textures[name] = t
-                return t
-
-        for filename in folder.glob('**/' + name + '.*'): # no file extention given, so try all supported
-            if filename.suffix in file_types:
-                # print('found:', filename)
-                t =  Texture(filename.resolve())
-                imported_textures[name] = t
-                return t
+    filename = find_texture(name, path)
+    if filename:
+        t =  Texture(filename)
+        imported_textures[name] = t
+        return t
 
     if has_psd_tools_installed:
         for folder in folders:
-            for filename in folder.glob('**/' + name + '.psd'):
+            for filename in asset_index.find(folder, name + '.psd'):
                 print('found uncompressed psd, compressing it...')
                 compress_textures(name)
                 return load_texture(name)
@@ -68,53 +51,97 @@ def load_texture(name, path=None):
 
 
 
-def compress_textures(name=''):
-    import os
+def _texture_folders(path=None):
+    if path:
+        if isinstance(path, str):
+            return (Path(path),)
+        return (path,)
+
+    return ( # folder search order
+        application.compressed_textures_folder,
+        application.asset_folder,
+        application.internal_textures_folder,
+        )
+
+
+def find_texture(name, path=None):
+    # returns the resolved path of the image file load_texture() would load, or None
+    for folder in _texture_folders(path):
+        if '.' in name: # got name with file extention
+            for filename in asset_index.find(folder, name):
+                return filename.resolve()
+
+        for filename in asset_index.find(folder, name + '.*'): # no file extention given, so try all supported
+            if filename.suffix in file_types:
+                # print('found:', filename)
+                return filename.resolve()
+
+    return None
+
+
+
+def compress_textures(name='', path=None, outpath=None, workers=1, force=False, on_progress=assets.print_progress):
+    # converts the .psd files, and .png files over 512 pixels without transparency, in path to .png and .jpg files in outpath,
+    # on workers processes at a time. files older than their converted version get skipped, unless force is True. returns the converted source files.
     try:
         from PIL import Image
     except Exception as e:
-        return e
-
-
-    if not application.compressed_textures_folder.exists():
-        application.compressed_textures_folder.mkdir()
+        print('can\'t compress textures without PIL:', e)
+        return list()
 
+    path = Path(path) if path else application.asset_folder
+    outpath = Path(outpath) if outpath else application.compressed_textures_folder
 
     file_type = '.*'
     if '.' in name:
         file_type = ''
+    if not name:
+        file_type = '*'
 
+    jobs = list()
     # print('searching for texture:', name + file_type)
-    for f in application.asset_folder.glob('**/' + name + file_type):
-        # if f.parent == application.compressed_textures_folder:
-        # print('------------------', str(f.resolve()))
-        if '\\textures_compressed\\' in str(f) or f.suffix not in ('.psd', '.png', '.jpg', '.jpeg', '.gif'):
+    for f in asset_index.find(path, name + file_type):
+        if outpath in f.parents or f.suffix not in ('.psd', '.png'):
             continue
-        # print('  found:', f)
-        image = None
-        if f.suffix == '.psd' and has_psd_tools_installed:
-            image = PSDImage.load(f)
-            image = image.as_PIL()
-        # elif f.suffix == '.png':
-        #     image = Image.open(f)
-
-        if not image:
-            return False
-        # print(max(image.size))
-        # print('............', image.mode)
-        if image and image.mode != 'RGBA' and max(image.size) > 512:
-            image.save(
-                application.compressed_textures_folder / (Path(f).stem + '.jpg'),
-                'JPEG',
-                quality=80,
-                optimize=True,
-                progressive=True
-                )
-            print('    compressing to jpg:', application.compressed_textures_folder / (f.stem + '.jpg'))
+        if f.suffix == '.psd' and not has_psd_tools_installed:
             continue
-        else:
-            image.save(application.compressed_textures_folder / (f.stem + '.png'), 'PNG')
-            print('    compressing to png:', application.compressed_textures_folder / (f.stem + '.png'))
+        if not force and assets.is_up_to_date(f, (outpath / (f.stem + '.jpg'), outpath / (f.stem + '.png'))):
+            continue
+        # print('  found:', f)
+        jobs.append((f, outpath))
+
+    if jobs:
+        outpath.mkdir(parents=True, exist_ok=True)
+    results = assets.run_jobs(_compress_texture, jobs, workers, on_progress=on_progress)
+    converted = [job[0] for job, result in zip(jobs, results) if result]
+    asset_index.invalidate(outpath)
+    return converted
+
+
+def _compress_texture(f, outpath):
+    # runs on a worker process. returns the compressed file, or None if it's fine as it is.
+    from PIL import Image
+    if f.suffix == '.psd':
+        from psd_tools import PSDImage
+        image = PSDImage.load(f)
+        image = image.as_PIL()
+    else:
+        image = Image.open(f)
+        if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info or max(image.size) <= 512:
+            return None
+
+    # print(max(image.size))
+    # print('............', image.mode)
+    if image.mode != 'RGBA' and max(image.size) > 512:
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        image.save(outpath / (f.stem + '.jpg'), 'JPEG', quality=80, optimize=True, progressive=True)
+        print('    compressing to jpg:', outpath / (f.stem + '.jpg'))
+        return outpath / (f.stem + '.jpg')
+
+    image.save(outpath / (f.stem + '.png'), 'PNG')
+    print('    compressing to png:', outpath / (f.stem + '.png'))
+    return outpath / (f.stem + '.png')
 
 
 
@@ -31,6 +31,7 @@ from ursina.raycaster import raycast, boxcast
 from ursina import color
 from ursina.input_handler import held_keys
 from ursina import input_handler
+from ursina import profiler
 
 
 class Empty():
@@ -75,6 +76,9 @@ def _destroy(entity):
         return
     if entity in scene.entities:
         scene.entities.remove(entity)
+    scene._unregister_callbacks(entity)
+    if hasattr(entity, '_set_parent_children'):
+        entity._set_parent_children(None)
 
     if hasattr(entity, 'on_destroy'):
         entity.on_destroy()
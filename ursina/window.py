@@ -3,7 +3,6 @@ import os
 from panda3d.core import WindowProperties
 from panda3d.core import loadPrcFileData
 from panda3d.core import Vec2
-from screeninfo import get_monitors
 from ursina.entity import Entity
 from ursina import color
 from ursina import application
@@ -30,28 +29,70 @@ class Window(WindowProperties):
         self.show_ursina_splash = False
 
         self.title = application.asset_folder.name
+        self._screen_resolution = None  # found the first time it's used, see screen_resolution
+        self._fullscreen_size = None    # screen_resolution + 1, unless set
+        self._windowed_size = None      # fullscreen_size / 1.25, unless set
+        self.aspect_ratio = 16 / 9      # until the size gets set in late_init()
+        self.windowed_position = None   # gets set when entering fullscreen so position will be correct when going back to windowed mode
+        self.borderless = True
+
+
+    def get_screen_resolution(self):
         if os.name == 'nt':     # windows
             import ctypes
             user32 = ctypes.windll.user32
-            self.screen_resolution = (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+            return Vec2(user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
 
-        else:
-            try:
-                self.screen_resolution = (get_monitors()[0].width, get_monitors()[0].height)
-                print('OS:', os.name)
-            except:
-                print('using default sceen resolution.', 'OS:', os.name)
-                self.screen_resolution = Vec2(1366, 768)
+        try:
+            from screeninfo import get_monitors
+            monitor = get_monitors()[0]
+            print('OS:', os.name)
+            return Vec2(monitor.width, monitor.height)
+        except:
+            print('using default sceen resolution.', 'OS:', os.name)
+            return Vec2(1366, 768)
 
-        print('screen resolution:', self.screen_resolution)
-        self.fullscreen_size = Vec2(self.screen_resolution[0]+1, self.screen_resolution[1]+1)
-        self.windowed_size = self.fullscreen_size / 1.25
-        self.windowed_position = None   # gets set when entering fullscreen so position will be correct when going back to windowed mode
-        self.size = self.windowed_size
-        self.borderless = True
+
+    @property
+    def screen_resolution(self):
+        # asks the os the first time it's used, so that doesn't happen in headless mode. uses 1366x768 there.
+        if self._screen_resolution is None:
+            if application.headless:
+                self._screen_resolution = Vec2(1366, 768)
+            else:
+                self._screen_resolution = self.get_screen_resolution()
+                print('screen resolution:', self._screen_resolution)
+        return self._screen_resolution
+
+    @screen_resolution.setter
+    def screen_resolution(self, value):
+        self._screen_resolution = value
+
+    @property
+    def fullscreen_size(self):
+        if self._fullscreen_size is None:
+            return Vec2(self.screen_resolution[0]+1, self.screen_resolution[1]+1)
+        return self._fullscreen_size
+
+    @fullscreen_size.setter
+    def fullscreen_size(self, value):
+        self._fullscreen_size = value
+
+    @property
+    def windowed_size(self):
+        if self._windowed_size is None:
+            return self.fullscreen_size / 1.25
+        return self._windowed_size
+
+    @windowed_size.setter
+    def windowed_size(self, value):
+        self._windowed_size = value
 
 
     def late_init(self):
+        if application.headless:    # with a window, setting fullscreen below sets the size
+            self.size = self.windowed_size
+
         self.position = Vec2(0,0)
         self.top = Vec2(0, .5)
         self.bottom = Vec2(0, .5)
@@ -119,6 +160,18 @@ class Window(WindowProperties):
             self.fps_counter.i += 1
         self.fps_counter.update = _fps_counter_update
 
+        from ursina import profiler
+        self.profiler_panel = Text(parent=self.editor_ui, eternal=True, position=(.5*self.aspect_ratio, .44, -999), origin=(.5,.5), scale=.75, text='', enabled=False, i=0)
+
+        def _profiler_panel_update():
+            if self.profiler_panel.i > 30:
+                self.profiler_panel.text = profiler.to_text()
+                self.profiler_panel.i = 0
+            self.profiler_panel.i += 1
+        self.profiler_panel.update = _profiler_panel_update
+        self.profiler_panel.on_enable = Func(profiler.set_enabled, True)
+        self.profiler_panel.on_disable = Func(profiler.set_enabled, False)
+
 
         import webbrowser
         self.cog_menu = ButtonList({
@@ -127,6 +180,8 @@ class Window(WindowProperties):
             # 'Open Scene Editor' : Func(print, ' '),
             'Change Render Mode <gray>[F10]<default>' : self.next_render_mode,
             'Reset Render Mode <gray>[F9]<default>' : Func(setattr, self, 'render_mode', 'default'),
+            'Toggle Profiler <gray>[F3]<default>' : self.toggle_profiler,
+            'Save Profiler Stats' : Func(profiler.save, application.asset_folder / 'profile.csv'),
             'Reload Models <gray>[F7]<default>' : application.hot_reloader.reload_models,
             'Reload Textures <gray>[F6]<default>' : application.hot_reloader.reload_textures,
             'Reload Code <gray>[F5]<default>' : application.hot_reloader.reload_code,
@@ -147,6 +202,13 @@ class Window(WindowProperties):
         self.cog_button.on_click = _toggle_cog_menu
         # print('-----------', time.time() - t) # 0.04
 
+
+    def toggle_profiler(self):
+        if not hasattr(self, 'profiler_panel'):    # no editor ui, like in headless mode
+            return
+        self.profiler_panel.enabled = not self.profiler_panel.enabled
+
+
     def update_aspect_ratio(self):
         from ursina import camera
         camera.ui_lens.set_film_size(camera.ui_size * .5 * self.aspect_ratio, camera.ui_size * .5)
@@ -154,6 +216,8 @@ class Window(WindowProperties):
 
     @property
     def size(self):
+        if not self.has_size():     # before late_init()
+            return Vec2(int(self.windowed_size[0]), int(self.windowed_size[1]))
         return Vec2(self.get_size()[0], self.get_size()[1])
 
     @size.setter
@@ -218,6 +282,10 @@ class Window(WindowProperties):
         except:
             pass
 
+        if application.headless and name in ('position', 'fullscreen', 'borderless', 'color'):
+            object.__setattr__(self, name, value)   # there's no window to apply these to
+            return
+
         if name == 'position':
             self.setOrigin(int(value[0]), int(value[1]))
             application.base.win.request_properties(self)